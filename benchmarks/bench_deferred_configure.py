@@ -0,0 +1,61 @@
+"""Benchmark coalesced widget updates during a simulated resize storm.
+
+Each frame of the storm sets the text and width of every label many times,
+as resize and DPI handlers tend to. The direct version calls configure()
+for every write; the deferred version queues them with defer_configure()
+and applies the last values in one flush per frame.
+
+Run with: python benchmarks/bench_deferred_configure.py [labels] [writes]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tkinter as tk
+
+from tkinter_unblur import Tk
+
+FRAMES = 60
+
+
+def main() -> None:
+    """Time direct and deferred configure writes for a resize storm."""
+    label_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    writes = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    root = Tk()
+    try:
+        labels = [tk.Label(root) for _ in range(label_count)]
+        for label in labels:
+            label.pack()
+        root.update_idletasks()
+
+        start = time.perf_counter()
+        for frame in range(FRAMES):
+            for i in range(writes):
+                for label in labels:
+                    label.configure(text=f"{frame}/{i}", width=10 + i)
+            root.update_idletasks()
+        direct = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for frame in range(FRAMES):
+            for i in range(writes):
+                for label in labels:
+                    root.defer_configure(label, "text", f"{frame}/{i}")
+                    root.defer_configure(label, "width", 10 + i)
+            root.update_idletasks()  # Runs the flush queued by defer_configure()
+        deferred = time.perf_counter() - start
+
+        total = FRAMES * writes * label_count
+        print(f"{FRAMES} frames, {label_count} labels, {writes} writes per frame")
+        print(f"  configure():       {direct * 1000:8.1f} ms ({total} Tcl calls)")
+        print(f"  defer_configure(): {deferred * 1000:8.1f} ms ({FRAMES} Tcl calls)")
+        print(f"  merged writes:     {root.merged_configures}")
+    finally:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
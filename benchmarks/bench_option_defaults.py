@@ -0,0 +1,70 @@
+"""Benchmark widget creation with scaled option database defaults.
+
+Compares creating widgets after Tk.install_scaled_defaults() with creating
+widgets and then scaling each one with configure().
+
+Run with: python benchmarks/bench_option_defaults.py [count]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tkinter as tk
+from unittest.mock import patch
+
+from tkinter_unblur import DpiInfo, Tk
+
+WIDGET_CLASSES = (tk.Button, tk.Label, tk.Entry, tk.Checkbutton, tk.Frame)
+PIXEL_OPTIONS = ("padx", "pady", "borderwidth", "highlightthickness")
+
+
+def create_with_defaults(root: Tk, count: int) -> float:
+    """Create widgets after installing scaled option database defaults."""
+    start = time.perf_counter()
+    root.install_scaled_defaults()
+    for i in range(count):
+        WIDGET_CLASSES[i % len(WIDGET_CLASSES)](root)
+    return time.perf_counter() - start
+
+
+def create_then_scale(root: Tk, count: int) -> float:
+    """Create widgets and then scale their pixel options one by one."""
+    start = time.perf_counter()
+    for i in range(count):
+        widget = WIDGET_CLASSES[i % len(WIDGET_CLASSES)](root)
+        scaled = {}
+        for option in PIXEL_OPTIONS:
+            try:
+                value = widget.cget(option)
+            except tk.TclError:
+                continue
+            try:
+                scaled[option] = root.scale_value(value)
+            except ValueError:
+                pass  # Distances with units, e.g. "3m"
+        widget.configure(**scaled)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run both variants on fresh windows and print the throughput."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"Creating {count} widgets at a simulated 150% scaling")
+
+    for name, bench in (
+        ("option database defaults", create_with_defaults),
+        ("create, then configure", create_then_scale),
+    ):
+        with patch("tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(144, 144)):
+            root = Tk()
+            root.withdraw()
+            try:
+                elapsed = bench(root, count)
+            finally:
+                root.destroy()
+        print(f"  {name:<26} {elapsed:7.3f} s  {count / elapsed:9.0f} widgets/s")
+
+
+if __name__ == "__main__":
+    main()
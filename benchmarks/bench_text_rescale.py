@@ -0,0 +1,68 @@
+"""Benchmark bulk rescaling of ScaledText tags on large documents.
+
+Fills a ScaledText with up to a million tagged lines and times rescale()
+after a simulated DPI change. The time depends on the number of tags, not
+on the number of lines.
+
+Run with: python benchmarks/bench_text_rescale.py [lines] [tags]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from unittest.mock import patch
+
+from tkinter_unblur import DpiInfo, ScaledText, Tk
+
+
+def main() -> None:
+    """Time rescale() for growing documents with a fixed number of tags."""
+    max_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tag_count = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+
+    with patch(
+        "tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(96, 96)
+    ) as get_dpi_info:
+        root = Tk()
+        try:
+            text = ScaledText(root, spacing1=2, tabs=(40, 80, 120))
+            text.pack()
+            for i in range(tag_count):
+                text.tag_configure(
+                    f"tag{i}",
+                    font=("Consolas", 9 + i % 4),
+                    spacing1=1,
+                    spacing3=2,
+                    lmargin1=i,
+                    rmargin=8,
+                    tabs=(48, 96),
+                )
+
+            lines = 0
+            size = 10_000
+            print(f"Rescaling {tag_count} tags")
+            while lines < max_lines:
+                chunk = "".join(f"{n}\tlog line\n" for n in range(lines, size))
+                text.insert("end", chunk)
+                for i in range(tag_count):
+                    text.tag_add(f"tag{i}", f"{lines + i + 1}.0", f"{lines + i + 2}.0")
+                lines = size
+                root.update_idletasks()
+
+                timings = []
+                for dpi in (144, 192, 120, 96):
+                    get_dpi_info.return_value = DpiInfo(dpi, dpi)
+                    root.update_dpi()  # Rescales each ScaledText once
+                    start = time.perf_counter()
+                    text.rescale()
+                    timings.append(time.perf_counter() - start)
+                best = min(timings) * 1000
+                print(f"  {lines:>9} lines: rescale() {best:7.3f} ms")
+                size *= 10
+        finally:
+            root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -21,20 +21,26 @@ Or scale values manually:
 
 from __future__ import annotations
 
-from tkinter_unblur.core import HdpiTk, Tk
+from tkinter_unblur.core import DpiInfo, HdpiTk, ScaleContext, Tk
+from tkinter_unblur.dispatch import UpdateDispatcher
 from tkinter_unblur.exceptions import (
     DPIDetectionError,
     TkinterUnblurError,
     UnsupportedPlatformError,
 )
+from tkinter_unblur.text import ScaledText
 
 __version__ = "2.0.1"
 __all__ = [
     "DPIDetectionError",
+    "DpiInfo",
     "HdpiTk",
+    "ScaleContext",
+    "ScaledText",
     "Tk",
     "TkinterUnblurError",
     "UnsupportedPlatformError",
+    "UpdateDispatcher",
     "__version__",
 ]
 
@@ -53,6 +59,6 @@ def _test() -> None:
     Note:
         This is equivalent to running: python -m tkinter_unblur
     """
-    from tkinter_unblur.__main__ import main
+    from tkinter_unblur.__main__ import demo
 
-    main()
+    demo()
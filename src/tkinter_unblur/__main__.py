@@ -1,16 +1,21 @@
-"""Demo application for tkinter-unblur.
+"""Command line interface and demo application for tkinter-unblur.
 
-Run with: python -m tkinter_unblur
+Run the demo with: python -m tkinter_unblur
+Pre-render assets with: python -m tkinter_unblur prerender <asset-dir>
 """
 
 from __future__ import annotations
 
+import argparse
+import os
+import sys
 import tkinter as tk
+from collections.abc import Sequence
 
 from tkinter_unblur import Tk, __version__
 
 
-def main() -> None:
+def demo() -> None:
     """Run the demo application."""
     root = Tk()
     root.title(f"tkinter-unblur v{__version__} Demo")
@@ -82,5 +87,71 @@ def main() -> None:
     root.mainloop()
 
 
+def _prerender(args: argparse.Namespace) -> int:
+    """Run the prerender command."""
+    from tkinter_unblur.assets import prerender
+
+    try:
+        result = prerender(
+            args.asset_dir, tuple(args.scales), workers=args.workers, force=args.force
+        )
+    except ImportError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    for name in result.rendered:
+        print(f"rendered {name}")
+    for name in result.failed:
+        print(f"error: cannot render {name}", file=sys.stderr)
+    print(
+        f"{len(result.rendered)} rendered, {len(result.skipped)} unchanged, "
+        f"{len(result.failed)} failed"
+    )
+    return 1 if result.failed else 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run a command, or the demo application if none is given.
+
+    Args:
+        argv: The command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        The exit status.
+    """
+    from tkinter_unblur.assets import SCALES
+
+    parser = argparse.ArgumentParser(
+        prog="python -m tkinter_unblur",
+        description="Run the tkinter-unblur demo, or a command.",
+    )
+    commands = parser.add_subparsers(dest="command")
+    prerender_parser = commands.add_parser(
+        "prerender",
+        help="render scaled variants of PNG and GIF assets (requires Pillow)",
+    )
+    prerender_parser.add_argument("asset_dir", help="the asset directory")
+    prerender_parser.add_argument(
+        "--scales",
+        type=float,
+        nargs="+",
+        default=SCALES,
+        help="scaling factors to render (default: %(default)s)",
+    )
+    prerender_parser.add_argument(
+        "--workers", type=int, help="number of worker processes (default: CPUs)"
+    )
+    prerender_parser.add_argument(
+        "--force", action="store_true", help="render unchanged assets too"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "prerender":
+        if not os.path.isdir(args.asset_dir):
+            parser.error(f"not a directory: {args.asset_dir}")
+        return _prerender(args)
+    demo()
+    return 0
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""Option database helpers for DPI-scaled widget defaults.
+
+Defaults written to Tk's option database are picked up by every widget at
+creation time, with no per-widget Python work. The built-in defaults of the
+standard widget classes are read once by probing one instance of each, and
+the scaled values are written back in a single Tcl call.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    import _tkinter
+
+__all__ = ["PRIORITY", "apply_defaults", "read_defaults", "scale_defaults"]
+
+# Above built-in widget defaults, below user X resources and options added
+# by the application (which default to the "interactive" priority)
+PRIORITY = "startupFile"
+
+# Configuration options whose values are screen distances in pixels
+PIXEL_SWITCHES = (
+    "-activeborderwidth",
+    "-borderwidth",
+    "-elementborderwidth",
+    "-highlightthickness",
+    "-insertborderwidth",
+    "-insertwidth",
+    "-padx",
+    "-pady",
+    "-sashpad",
+    "-sashwidth",
+    "-selectborderwidth",
+    "-sliderlength",
+)
+
+# Standard widget commands, with any class-specific pixel options. The width
+# of most widgets is in characters, but not for scales and scrollbars.
+WIDGET_SWITCHES = {
+    "button": PIXEL_SWITCHES,
+    "canvas": PIXEL_SWITCHES,
+    "checkbutton": PIXEL_SWITCHES,
+    "entry": PIXEL_SWITCHES,
+    "frame": PIXEL_SWITCHES,
+    "label": PIXEL_SWITCHES,
+    "labelframe": PIXEL_SWITCHES,
+    "listbox": PIXEL_SWITCHES,
+    "menu": PIXEL_SWITCHES,
+    "menubutton": PIXEL_SWITCHES,
+    "message": PIXEL_SWITCHES,
+    "panedwindow": PIXEL_SWITCHES,
+    "radiobutton": PIXEL_SWITCHES,
+    "scale": (*PIXEL_SWITCHES, "-width"),
+    "scrollbar": (*PIXEL_SWITCHES, "-width"),
+    "spinbox": PIXEL_SWITCHES,
+    "text": PIXEL_SWITCHES,
+}
+
+# Returns a flat list of option patterns and built-in default values
+_READ_SCRIPT = """{widgets} {
+    set result {}
+    set probe .__tkinter_unblur_probe
+    foreach {command switches} $widgets {
+        $command $probe
+        set class [winfo class $probe]
+        foreach switch $switches {
+            if {![catch {$probe configure $switch} spec]} {
+                lassign $spec - name - default
+                lappend result *$class.$name $default
+            }
+        }
+        destroy $probe
+    }
+    return $result
+}"""
+
+# Adds a flat list of option patterns and values in one call
+_APPLY_SCRIPT = """{settings priority} {
+    foreach {pattern value} $settings {
+        option add $pattern $value $priority
+    }
+}"""
+
+
+def read_defaults(tkapp: _tkinter.TkappType) -> dict[str, str]:
+    """Read the built-in pixel defaults of the standard widget classes.
+
+    Args:
+        tkapp: The Tcl interpreter of a Tk window.
+
+    Returns:
+        A mapping of option database pattern (e.g. "*Button.padX") to the
+        built-in default value.
+    """
+    widgets = tuple(
+        item
+        for command, switches in WIDGET_SWITCHES.items()
+        for item in (command, switches)
+    )
+    items = tkapp.splitlist(tkapp.call("apply", _READ_SCRIPT, widgets))
+    return {str(pattern): str(value) for pattern, value in zip(items[::2], items[1::2])}
+
+
+def scale_defaults(
+    defaults: dict[str, str], scale_func: Callable[[int], int]
+) -> tuple[str, ...]:
+    """Build the settings for apply_defaults() from logical defaults.
+
+    Defaults with units such as "3m" are physical sizes and are skipped, as
+    are zero values, which stay zero at any scaling.
+
+    Args:
+        defaults: Logical defaults as returned by read_defaults().
+        scale_func: A function returning the scaled value of a pixel count.
+
+    Returns:
+        A flat tuple of option patterns and scaled values.
+    """
+    settings: list[str] = []
+    for pattern, value in defaults.items():
+        try:
+            pixels = int(value)
+        except ValueError:
+            continue
+        if pixels:
+            settings += [pattern, str(scale_func(pixels))]
+    return tuple(settings)
+
+
+def apply_defaults(tkapp: _tkinter.TkappType, settings: tuple[object, ...]) -> None:
+    """Add settings to the option database in a single Tcl call.
+
+    Args:
+        tkapp: The Tcl interpreter of a Tk window.
+        settings: A flat tuple of option patterns and values.
+    """
+    if settings:
+        tkapp.call("apply", _APPLY_SCRIPT, settings, PRIORITY)
@@ -0,0 +1,227 @@
+"""ttk style database scaling helpers.
+
+ttk widgets take padding, border widths, arrow sizes, row heights and fonts
+from their styles rather than widget options, so these are scaled at the
+style level. Reading and writing the style database each take a single Tcl
+call, regardless of the number of styles.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+if TYPE_CHECKING:
+    import _tkinter
+
+__all__ = ["apply_styles", "merge_styles", "read_styles", "scale_font", "scale_styles"]
+
+# Style options whose values are one or more screen distances in pixels
+PIXEL_OPTIONS = frozenset(
+    {
+        "-arrowpadding",
+        "-arrowsize",
+        "-borderwidth",
+        "-focusthickness",
+        "-indicatordiameter",
+        "-indicatormargin",
+        "-indicatorsize",
+        "-insertwidth",
+        "-labelmargins",
+        "-padding",
+        "-rowheight",
+        "-sashthickness",
+        "-sliderlength",
+        "-sliderthickness",
+        "-tabmargins",
+    }
+)
+
+# Styles to read when "ttk::style theme styles" is unavailable (Tk < 8.6.10)
+FALLBACK_STYLES = (
+    ".",
+    "TButton",
+    "TCheckbutton",
+    "TCombobox",
+    "TEntry",
+    "TFrame",
+    "TLabel",
+    "TLabelframe",
+    "TMenubutton",
+    "TNotebook",
+    "TNotebook.Tab",
+    "TPanedwindow",
+    "TProgressbar",
+    "TRadiobutton",
+    "TScale",
+    "TScrollbar",
+    "TSpinbox",
+    "Toolbutton",
+    "Treeview",
+    "Heading",
+)
+
+# Returns a flat list of style names and their "ttk::style configure" output
+_READ_SCRIPT = """{theme fallback} {
+    if {[catch {ttk::style theme styles $theme} styles]} {
+        set styles $fallback
+    }
+    set result {}
+    ttk::style theme settings $theme {
+        foreach style [lsort -unique [linsert $styles 0 .]] {
+            lappend result $style [ttk::style configure $style]
+        }
+    }
+    return $result
+}"""
+
+# Applies a flat list of style names and option/value lists in one call
+_APPLY_SCRIPT = """{theme settings} {
+    ttk::style theme settings $theme {
+        foreach {style options} $settings {
+            ttk::style configure $style {*}$options
+        }
+    }
+}"""
+
+# A scaled option value: a pixel list or a font description
+_Value = Union[str, tuple[str, ...]]
+
+
+def read_styles(tkapp: _tkinter.TkappType, theme: str) -> dict[str, dict[str, str]]:
+    """Read the configured options of every style in a theme.
+
+    Args:
+        tkapp: The Tcl interpreter of a Tk window.
+        theme: The theme name.
+
+    Returns:
+        A mapping of style name to its configured options and values,
+        restricted to the options that scale_styles() rescales.
+    """
+    result = tkapp.call("apply", _READ_SCRIPT, theme, FALLBACK_STYLES)
+    items = tkapp.splitlist(result)
+    styles: dict[str, dict[str, str]] = {}
+    for style, configured in zip(items[::2], items[1::2]):
+        options = tkapp.splitlist(configured)
+        scalable = {
+            str(option): str(value)
+            for option, value in zip(options[::2], options[1::2])
+            if option in PIXEL_OPTIONS or option == "-font"
+        }
+        if scalable:
+            styles[str(style)] = scalable
+    return styles
+
+
+def merge_styles(
+    current: dict[str, dict[str, str]],
+    logical: dict[str, dict[str, str]],
+    applied: dict[str, dict[str, str]],
+) -> dict[str, dict[str, str]]:
+    """Return the logical style values, updated with later configuration.
+
+    Options still holding the value that was applied are scaled values and
+    keep their logical value. Options configured since then, or never
+    scaled, take their current value as logical.
+
+    Args:
+        current: Style values as currently read by read_styles().
+        logical: The logical values the applied settings were scaled from.
+        applied: Style values as read right after applying them.
+
+    Returns:
+        The logical values of all styles in current.
+    """
+    merged: dict[str, dict[str, str]] = {}
+    for style, options in current.items():
+        previous = logical.get(style, {})
+        scaled = applied.get(style, {})
+        merged[style] = {
+            option: (
+                previous[option]
+                if option in previous and scaled.get(option) == value
+                else value
+            )
+            for option, value in options.items()
+        }
+    return merged
+
+
+def scale_font(
+    tkapp: _tkinter.TkappType,
+    font: str | tuple[Any, ...],
+    scale_func: Callable[[int], int],
+) -> _Value | None:
+    """Scale the size of a font description, or return None if it has none.
+
+    Named fonts such as "TkDefaultFont" are shared by every widget and are
+    left alone.
+    """
+    parts = tkapp.splitlist(font)
+    if len(parts) < 2:
+        return None
+    try:
+        size = int(parts[1])
+    except ValueError:
+        return None
+    return (str(parts[0]), str(scale_func(size)), *map(str, parts[2:]))
+
+
+def _scale_pixels(
+    tkapp: _tkinter.TkappType, value: str, scale_func: Callable[[int], int]
+) -> _Value | None:
+    """Scale a list of pixel distances, or return None if any is not a number.
+
+    Distances with units such as "2m" or "1c" are physical sizes and are
+    already resolution independent.
+    """
+    try:
+        pixels = [int(float(part)) for part in tkapp.splitlist(value)]
+    except ValueError:
+        return None
+    scaled = tuple(str(scale_func(pixel)) for pixel in pixels)
+    return scaled[0] if len(scaled) == 1 else scaled
+
+
+def scale_styles(
+    tkapp: _tkinter.TkappType,
+    styles: dict[str, dict[str, str]],
+    scale_func: Callable[[int], int],
+) -> tuple[Any, ...]:
+    """Build the settings for apply_styles() from logical style values.
+
+    Args:
+        tkapp: The Tcl interpreter, used to split Tcl lists.
+        styles: Logical style values as returned by read_styles().
+        scale_func: A function returning the scaled value of a pixel count.
+
+    Returns:
+        A flat tuple of style names and option/value tuples.
+    """
+    settings: list[Any] = []
+    for style, options in styles.items():
+        scaled: list[_Value] = []
+        for option, value in options.items():
+            if option == "-font":
+                new_value = scale_font(tkapp, value, scale_func)
+            else:
+                new_value = _scale_pixels(tkapp, value, scale_func)
+            if new_value is not None:
+                scaled += [option, new_value]
+        if scaled:
+            settings += [style, tuple(scaled)]
+    return tuple(settings)
+
+
+def apply_styles(
+    tkapp: _tkinter.TkappType, theme: str, settings: tuple[Any, ...]
+) -> None:
+    """Configure all styles of a theme from settings in a single Tcl call.
+
+    Args:
+        tkapp: The Tcl interpreter of a Tk window.
+        theme: The theme name.
+        settings: Settings as returned by scale_styles().
+    """
+    if settings:
+        tkapp.call("apply", _APPLY_SCRIPT, theme, settings)
@@ -9,7 +9,7 @@ import logging
 from ctypes import POINTER, WinDLL, byref, c_uint
 from ctypes.wintypes import DWORD, HMONITOR, HWND
 
-__all__ = ["get_dpi_info_windows"]
+__all__ = ["get_dpi_info_windows", "set_process_dpi_awareness"]
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +18,36 @@ DPI_100_PERCENT = 96
 DPI_TYPE_EFFECTIVE = 0  # MDT_EFFECTIVE_DPI
 MONITOR_DEFAULTTONEAREST = 2
 
+_awareness_set = False
+
+
+def set_process_dpi_awareness() -> None:
+    """Enable system DPI awareness for the process.
+
+    This happens after the first window is created, so that Tk still
+    computes "tk scaling" at 96 DPI and the library alone scales fonts.
+    Only the first call has an effect.
+    """
+    global _awareness_set
+    if _awareness_set:
+        return
+    _awareness_set = True
+
+    try:
+        shcore = WinDLL("shcore")
+    except OSError:
+        logger.warning("Failed to load shcore.dll for DPI awareness")
+        return
+
+    try:
+        shcore.SetProcessDpiAwareness(1)
+        logger.debug("SetProcessDpiAwareness(1) succeeded")
+    except OSError:
+        # This can fail on Windows Server or older Windows versions
+        logger.debug(
+            "SetProcessDpiAwareness failed (may be already set or unsupported)"
+        )
+
 
 def get_dpi_info_windows(window_handle: int) -> tuple[int, int, float]:
     """Get DPI information on Windows platform.
@@ -35,15 +65,7 @@ def get_dpi_info_windows(window_handle: int) -> tuple[int, int, float]:
         logger.warning("Failed to load Windows DLLs for DPI detection")
         return 96, 96, 1.0
 
-    # Set process DPI awareness
-    try:
-        shcore.SetProcessDpiAwareness(1)
-        logger.debug("SetProcessDpiAwareness(1) succeeded")
-    except OSError:
-        # This can fail on Windows Server or older Windows versions
-        logger.debug(
-            "SetProcessDpiAwareness failed (may be already set or unsupported)"
-        )
+    set_process_dpi_awareness()
 
     # Get monitor handle for the window
     user32.MonitorFromWindow.restype = HMONITOR
@@ -0,0 +1,70 @@
+"""asyncio integration for Tkinter applications.
+
+Runs Tk event processing as an asyncio task instead of a blocking
+mainloop(), so network clients and the GUI can share one thread. Pending
+Tcl events are processed without waiting, and the task sleeps between
+polls with an interval that grows while the application is idle and
+drops back to zero as soon as events arrive.
+
+Example:
+    >>> import asyncio
+    >>> from tkinter_unblur import Tk, aio
+    >>>
+    >>> async def main() -> None:
+    ...     root = Tk()
+    ...     asyncio.create_task(watch_dpi(root))
+    ...     await aio.mainloop(root)
+    >>>
+    >>> asyncio.run(main())
+"""
+
+from __future__ import annotations
+
+import _tkinter
+import asyncio
+import logging
+from tkinter import TclError
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tkinter import Misc
+
+__all__ = ["mainloop"]
+
+logger = logging.getLogger(__name__)
+
+# Events processed per poll before yielding to other tasks
+_MAX_BATCH = 100
+
+
+def _exists(root: Misc) -> bool:
+    """Return whether the window still exists."""
+    try:
+        return bool(root.winfo_exists())
+    except TclError:
+        return False
+
+
+async def mainloop(
+    root: Misc, min_interval: float = 0.001, max_interval: float = 0.02
+) -> None:
+    """Process Tk events cooperatively until the window is destroyed.
+
+    Args:
+        root: The Tk window.
+        min_interval: The first sleep in seconds after the last event.
+        max_interval: The longest sleep in seconds while idle. This bounds
+            the latency of the first event after an idle period.
+    """
+    tkapp = root.tk
+    interval = 0.0
+    while _exists(root):
+        processed = 0
+        while processed < _MAX_BATCH and tkapp.dooneevent(_tkinter.DONT_WAIT):
+            processed += 1
+        if processed:
+            interval = 0.0
+        else:
+            interval = min(max(interval * 2, min_interval), max_interval)
+        await asyncio.sleep(interval)
+    logger.debug("Window destroyed, leaving asyncio mainloop")
@@ -0,0 +1,296 @@
+"""Image assets pre-rendered for several DPI scales.
+
+Tk scales fonts but not images, and PhotoImage.zoom() only scales by whole
+factors without filtering. prerender() resamples every PNG and GIF in an
+asset directory once, offline, into variants such as "save@1.5x.png", and
+records them in a manifest. AssetLoader reads the manifest at runtime and
+picks the variant closest to the window's scaling, without scanning the
+directory or resampling anything.
+
+Pre-rendering requires Pillow (``pip install tkinter-unblur[prerender]``).
+Loading does not.
+
+Example:
+    $ python -m tkinter_unblur prerender assets/
+
+    >>> loader = AssetLoader("assets", root)
+    >>> button = tk.Button(root, image=loader.image("icons/save.png"))
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tkinter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from tkinter_unblur.core import Tk
+
+__all__ = [
+    "MANIFEST_NAME",
+    "SCALES",
+    "AssetLoader",
+    "PrerenderResult",
+    "load_manifest",
+    "prerender",
+    "variant_name",
+]
+
+logger = logging.getLogger(__name__)
+
+# Scaling factors rendered by default, besides the 100% original
+SCALES = (1.25, 1.5, 1.75, 2.0)
+
+# Image formats Tk 8.6 reads natively
+EXTENSIONS = frozenset({".gif", ".png"})
+
+MANIFEST_NAME = "unblur-manifest.json"
+MANIFEST_VERSION = 1
+
+# Matches the stem of a rendered variant, e.g. "save@1.5x"
+_VARIANT_STEM = re.compile(r"@\d+(?:\.\d+)?x$")
+
+
+class PrerenderResult(NamedTuple):
+    """The asset names rendered, skipped and failed by prerender()."""
+
+    rendered: tuple[str, ...]
+    skipped: tuple[str, ...]
+    failed: tuple[str, ...] = ()
+
+
+def variant_name(name: str, scale: float) -> str:
+    """Return the name of the variant of an asset at a scaling factor.
+
+    Args:
+        name: The asset name, relative to the asset directory.
+        scale: The scaling factor, e.g. 1.5.
+
+    Returns:
+        The variant name, e.g. "icons/save@1.5x.png" for "icons/save.png".
+    """
+    path = Path(name)
+    return path.with_name(f"{path.stem}@{scale:g}x{path.suffix}").as_posix()
+
+
+def load_manifest(asset_dir: str | os.PathLike[str]) -> dict[str, Any]:
+    """Read the manifest of an asset directory.
+
+    A missing or unreadable manifest is treated as empty, so every asset is
+    rendered again and loaders fall back to the original images.
+
+    Args:
+        asset_dir: The asset directory.
+
+    Returns:
+        The manifest, with an "assets" mapping of asset name to its
+        "sha256" digest, original "size" and "variants" (scale to name).
+    """
+    path = Path(asset_dir) / MANIFEST_NAME
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        manifest = None
+    except ValueError:
+        logger.warning(f"Ignoring invalid asset manifest {path}")
+        manifest = None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "assets": {}}
+    return manifest
+
+
+def _require_pillow() -> None:
+    """Raise ImportError with install instructions if Pillow is missing."""
+    try:
+        import PIL  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "Pre-rendering assets requires Pillow. "
+            "Install it with: pip install tkinter-unblur[prerender]"
+        ) from exc
+
+
+def _render(source: str, outputs: tuple[tuple[float, str], ...]) -> tuple[int, int]:
+    """Write resampled variants of an image. Runs in a worker process.
+
+    Images are resampled in RGBA with a Lanczos filter, so edges stay sharp
+    and transparency does not bleed. Animated GIFs keep their first frame.
+
+    Returns:
+        The width and height of the original image.
+    """
+    from PIL import Image
+
+    with Image.open(source) as image:
+        width, height = image.size
+        original = image.convert("RGBA")
+    for scale, target in outputs:
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        original.resize(size, Image.Resampling.LANCZOS).save(target)
+    return width, height
+
+
+def prerender(
+    asset_dir: str | os.PathLike[str],
+    scales: tuple[float, ...] = SCALES,
+    workers: int | None = None,
+    force: bool = False,
+) -> PrerenderResult:
+    """Render scaled variants of every PNG and GIF in an asset directory.
+
+    Variants are written next to their originals, and the manifest is
+    rewritten to list every asset. Assets whose content digest and scales
+    match the manifest, and whose variants exist, are skipped. The others
+    are rendered in parallel in a process pool. Assets that cannot be read
+    or decoded are logged and left out of the manifest, so they are tried
+    again on the next run; the other assets are still recorded.
+
+    Args:
+        asset_dir: The asset directory, searched recursively.
+        scales: The scaling factors to render, besides the original.
+        workers: The number of worker processes. Defaults to the number of
+            CPUs.
+        force: Render every asset, even if unchanged.
+
+    Returns:
+        The names of the rendered, skipped and failed assets.
+
+    Raises:
+        ImportError: If an asset needs rendering and Pillow is not installed.
+    """
+    root = Path(asset_dir)
+    scales = tuple(sorted(set(scales) - {1.0}))
+    previous = load_manifest(root)["assets"]
+    sources = sorted(
+        path
+        for path in root.rglob("*")
+        if path.suffix.lower() in EXTENSIONS
+        and not _VARIANT_STEM.search(path.stem)
+        and path.is_file()
+    )
+
+    assets: dict[str, dict[str, Any]] = {}
+    pending: list[str] = []
+    skipped: list[str] = []
+    failed: list[str] = []
+    for path in sources:
+        name = path.relative_to(root).as_posix()
+        try:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError as exc:
+            logger.warning(f"Cannot read asset {name}: {exc}")
+            failed.append(name)
+            continue
+        variants = {f"{scale:g}": variant_name(name, scale) for scale in scales}
+        entry = previous.get(name)
+        if (
+            not force
+            and entry is not None
+            and entry.get("sha256") == digest
+            and entry.get("variants") == variants
+            and all((root / variant).is_file() for variant in variants.values())
+        ):
+            assets[name] = entry
+            skipped.append(name)
+        else:
+            assets[name] = {"sha256": digest, "size": None, "variants": variants}
+            pending.append(name)
+
+    if pending:
+        _require_pillow()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures: dict[str, Future[tuple[int, int]]] = {
+                name: executor.submit(
+                    _render,
+                    str(root / name),
+                    tuple(
+                        (scale, str(root / variant_name(name, scale)))
+                        for scale in scales
+                    ),
+                )
+                for name in pending
+            }
+            for name, future in futures.items():
+                try:
+                    assets[name]["size"] = list(future.result())
+                except Exception as exc:
+                    # e.g. PIL.UnidentifiedImageError for a corrupt image
+                    logger.warning(f"Cannot render asset {name}: {exc}")
+                    del assets[name]
+                    failed.append(name)
+
+    manifest = {"version": MANIFEST_VERSION, "assets": assets}
+    path = root / MANIFEST_NAME
+    temporary = path.with_name(f"{MANIFEST_NAME}.tmp")
+    temporary.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    os.replace(temporary, path)
+    rendered = tuple(name for name in pending if name in assets)
+    logger.debug(
+        f"Rendered {len(rendered)} assets, skipped {len(skipped)}, failed {len(failed)}"
+    )
+    return PrerenderResult(rendered, tuple(skipped), tuple(sorted(failed)))
+
+
+class AssetLoader:
+    """Loads the pre-rendered variant of an asset closest to a window's DPI.
+
+    The manifest is read once, when the loader is created. Assets missing
+    from it are loaded from their original file. Images are cached per file,
+    so Tk keeps them alive and each file is decoded once.
+    """
+
+    def __init__(self, asset_dir: str | os.PathLike[str], root: Tk) -> None:
+        """Create a loader for an asset directory.
+
+        Args:
+            asset_dir: The asset directory passed to prerender().
+            root: The window whose DPI scaling selects the variants.
+        """
+        self._dir = Path(asset_dir)
+        self._root = root
+        self._assets: dict[str, dict[str, Any]] = load_manifest(self._dir)["assets"]
+        self._images: dict[Path, tkinter.PhotoImage] = {}
+
+    def path(self, name: str, scaling: float | None = None) -> Path:
+        """Return the file of the variant of an asset closest to a scaling.
+
+        Ties go to the larger variant, as downscaled images stay sharp.
+
+        Args:
+            name: The asset name, relative to the asset directory.
+            scaling: The scaling factor. Defaults to the window's scaling.
+
+        Returns:
+            The path of the variant, or of the original image.
+        """
+        if scaling is None:
+            scaling = self._root.dpi_scaling
+        variants = self._assets.get(name, {}).get("variants", {})
+        candidates: list[tuple[float, str]] = [(1.0, name)]
+        candidates += [(float(scale), variant) for scale, variant in variants.items()]
+        _, best = min(
+            candidates,
+            key=lambda candidate: (abs(candidate[0] - scaling), -candidate[0]),
+        )
+        return self._dir / best
+
+    def image(self, name: str) -> tkinter.PhotoImage:
+        """Return a PhotoImage of an asset for the window's current DPI.
+
+        Args:
+            name: The asset name, relative to the asset directory.
+        """
+        path = self.path(name)
+        image = self._images.get(path)
+        if image is None:
+            image = tkinter.PhotoImage(master=self._root, file=path)
+            self._images[path] = image
+        return image
@@ -9,18 +9,166 @@ from __future__ import annotations
 import logging
 import re
 import sys
+import weakref
+from fractions import Fraction
+from functools import lru_cache
+from tkinter import Misc, TclError
 from tkinter import Tk as _TkBase
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, NamedTuple, overload
+
+from tkinter_unblur import _options, _styles
 
 if TYPE_CHECKING:
-    from re import Match
+    import asyncio
+    from collections.abc import Iterator
+
+    from tkinter_unblur.text import ScaledText
 
-__all__ = ["Tk"]
+__all__ = ["DpiInfo", "ScaleContext", "Tk"]
 
 logger = logging.getLogger(__name__)
 
+_DPI_100_PERCENT = 96
+
+# Binding tag of the root window that checks for DPI changes. A tag of its
+# own survives bind() calls that replace the window's bindings, and does not
+# see the Configure events of child widgets.
+_DPI_BINDTAG = "TkinterUnblurDpi"
+
+# Configures widgets from a flat list of widget paths and option lists in
+# one call. Destroyed widgets are skipped, and errors are collected so one
+# bad write does not drop the others.
+_CONFIGURE_SCRIPT = """{writes} {
+    set errors {}
+    foreach {widget options} $writes {
+        if {[winfo exists $widget]
+                && [catch {$widget configure {*}$options} message]} {
+            lappend errors "$widget: $message"
+        }
+    }
+    return $errors
+}"""
+
+
+class DpiInfo:
+    """Immutable DPI information with precomputed scaling factors.
+
+    Instances are interned per (dpi_x, dpi_y): every window and cache on the
+    same DPI shares one object, so DPI values can be compared with ``is``.
+    DPI information holds plain numbers and never touches Tcl, so worker
+    threads can use it to scale values without locks.
+
+    For compatibility with code expecting a (dpi_x, dpi_y, scaling) tuple,
+    instances can be unpacked.
+
+    Attributes:
+        dpi_x: Horizontal DPI value (96 = 100% scaling), or None on non-Windows.
+        dpi_y: Vertical DPI value (96 = 100% scaling), or None on non-Windows.
+        scaling: The scaling factor (1.0 = 100%, 1.5 = 150%, etc.).
+        ratio: The scaling factor as an exact (numerator, denominator) pair.
+        inverse: The reciprocal of the scaling factor, for unscaling.
+        factor_x: The horizontal scaling factor.
+        factor_y: The vertical scaling factor.
+
+    Example:
+        >>> info = DpiInfo(144, 144)
+        >>> info.scaling, info.ratio
+        (1.5, (3, 2))
+        >>> info is DpiInfo(144, 144)
+        True
+    """
+
+    __slots__ = (
+        "dpi_x",
+        "dpi_y",
+        "factor_x",
+        "factor_y",
+        "inverse",
+        "ratio",
+        "scaling",
+    )
 
-def _get_dpi_info(window_handle: int) -> tuple[int | None, int | None, float]:
+    dpi_x: int | None
+    dpi_y: int | None
+    scaling: float
+    ratio: tuple[int, int]
+    inverse: float
+    factor_x: float
+    factor_y: float
+
+    _instances: ClassVar[dict[tuple[int | None, int | None], DpiInfo]] = {}
+
+    def __new__(cls, dpi_x: int | None = None, dpi_y: int | None = None) -> DpiInfo:
+        """Return the shared DPI information for the given DPI values."""
+        key = (dpi_x, dpi_y)
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
+
+        if dpi_x and dpi_y:
+            ratio = Fraction(dpi_x + dpi_y, 2 * _DPI_100_PERCENT)
+            factor_x = dpi_x / _DPI_100_PERCENT
+            factor_y = dpi_y / _DPI_100_PERCENT
+        else:
+            ratio = Fraction(1)
+            factor_x = factor_y = 1.0
+
+        instance = super().__new__(cls)
+        for name, value in (
+            ("dpi_x", dpi_x),
+            ("dpi_y", dpi_y),
+            ("scaling", float(ratio)),
+            ("ratio", (ratio.numerator, ratio.denominator)),
+            ("inverse", float(1 / ratio)),
+            ("factor_x", factor_x),
+            ("factor_y", factor_y),
+        ):
+            object.__setattr__(instance, name, value)
+        # setdefault keeps a single instance if two threads race here
+        return cls._instances.setdefault(key, instance)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> tuple[type[DpiInfo], tuple[int | None, int | None]]:
+        # Unpickling and copying go through __new__, preserving interning
+        return DpiInfo, (self.dpi_x, self.dpi_y)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(dpi_x={self.dpi_x!r}, dpi_y={self.dpi_y!r})"
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter((self.dpi_x, self.dpi_y, self.scaling))
+
+    def scale_value(self, value: float | str) -> int:
+        """Scale a value by the scaling factor, as Tk.scale_value()."""
+        return int(float(value) * self.scaling)
+
+    def unscale_value(self, value: float | str) -> int:
+        """Convert a scaled value back to logical units, rounding to nearest."""
+        return round(float(value) * self.inverse)
+
+    def scale_point(self, x: float, y: float) -> tuple[int, int]:
+        """Scale a coordinate pair by the per-axis scaling factors."""
+        return int(x * self.factor_x), int(y * self.factor_y)
+
+    def scale_geometry(self, geometry: str) -> str:
+        """Scale a geometry string, as Tk.scale_geometry()."""
+        return _parse_geometry(geometry).format(self.scale_value)
+
+    def unscale_geometry(self, geometry: str) -> str:
+        """Convert a scaled geometry string back to logical units."""
+        return _parse_geometry(geometry).format(self.unscale_value)
+
+
+# Alias kept for code written against the earlier snapshot type
+ScaleContext = DpiInfo
+
+
+def _get_dpi_info(window_handle: int) -> DpiInfo:
     """Get DPI information for a window.
 
     Detects the DPI settings for the monitor containing the specified window
@@ -30,59 +178,118 @@ def _get_dpi_info(window_handle: int) -> tuple[int | None, int | None, float]:
         window_handle: The native window handle (HWND on Windows).
 
     Returns:
-        A tuple of (dpi_x, dpi_y, scaling_factor):
+        The shared DpiInfo for the detected DPI. It unpacks as a tuple of
+        (dpi_x, dpi_y, scaling_factor):
         - dpi_x: Horizontal DPI (96 = 100% scaling), or None on non-Windows
         - dpi_y: Vertical DPI (96 = 100% scaling), or None on non-Windows
         - scaling_factor: The scaling multiplier (1.0 = 100%, 1.5 = 150%, etc.)
 
     Note:
-        On non-Windows platforms, returns (None, None, 1.0) as DPI awareness
-        is typically handled by the OS.
+        On non-Windows platforms, returns DpiInfo(None, None) with a scaling
+        of 1.0, as DPI awareness is typically handled by the OS.
     """
     if sys.platform != "win32":
         logger.debug("Non-Windows platform detected, skipping DPI detection")
-        return None, None, 1.0
+        return DpiInfo(None, None)
 
     # Import Windows-specific module only on Windows
     from tkinter_unblur._windows import get_dpi_info_windows
 
-    x, y, scaling = get_dpi_info_windows(window_handle)
-    return x, y, scaling
+    x, y, _ = get_dpi_info_windows(window_handle)
+    return DpiInfo(x, y)
+
+
+def _enable_dpi_awareness() -> None:
+    """Make the process DPI aware, once its first window exists.
+
+    On non-Windows platforms this does nothing, as DPI awareness is
+    typically handled by the OS.
+    """
+    if sys.platform != "win32":
+        return
+
+    from tkinter_unblur._windows import set_process_dpi_awareness
+
+    set_process_dpi_awareness()
+
+
+class _Geometry(NamedTuple):
+    """A parsed Tkinter geometry string.
+
+    Components missing from the original string are None, so that partial
+    geometries such as "800x600" or "+100+50" round-trip unchanged.
+    """
+
+    width: int | None
+    height: int | None
+    x_sign: str | None
+    x: int | None
+    y_sign: str | None
+    y: int | None
+
+    def format(self, scale_func: Callable[[int], int]) -> str:
+        """Format the geometry, applying scale_func to each numeric component."""
+        result = ""
+        if self.width is not None and self.height is not None:
+            result += f"{scale_func(self.width)}x{scale_func(self.height)}"
+        if self.x is not None and self.y is not None:
+            result += (
+                f"{self.x_sign}{scale_func(self.x)}{self.y_sign}{scale_func(self.y)}"
+            )
+        return result
+
+    def update(self, other: _Geometry) -> _Geometry:
+        """Return this geometry with the components present in other replaced."""
+        size = other if other.width is not None else self
+        position = other if other.x is not None else self
+        return _Geometry(
+            size.width,
+            size.height,
+            position.x_sign,
+            position.x,
+            position.y_sign,
+            position.y,
+        )
+
+
+_GEOMETRY_PATTERN = re.compile(
+    r"=?(?:(?P<W>\d+)x(?P<H>\d+))?(?:(?P<XS>[+-])(?P<X>-?\d+)(?P<YS>[+-])(?P<Y>-?\d+))?"
+)
 
 
-def _scale_geometry(geometry: str, scale_func: Callable[[str], int]) -> str:
-    """Scale a Tkinter geometry string.
+@lru_cache(maxsize=256)
+def _parse_geometry(geometry: str) -> _Geometry:
+    """Parse a Tkinter geometry string into its components.
 
-    Converts a geometry string like "800x600+100+50" by applying the
-    scale function to each numeric component.
+    Accepts any of the forms understood by "wm geometry": "WxH", "+X+Y" or
+    "WxH+X+Y", with an optional leading "=" and "+"/"-" offsets. Results are
+    memoized, since applications tend to pass the same few literals.
 
     Args:
-        geometry: A Tkinter geometry string in format "WxH+X+Y".
-        scale_func: A function that takes a string number and returns
-            the scaled integer value.
+        geometry: A Tkinter geometry string.
 
     Returns:
-        The scaled geometry string.
+        The parsed geometry.
 
     Raises:
         ValueError: If the geometry string format is invalid.
-
-    Example:
-        >>> scale_geometry("800x600+100+50", lambda v: int(float(v) * 1.5))
-        "1200x900+150+75"
     """
-    pattern = r"(?P<W>\d+)x(?P<H>\d+)\+(?P<X>-?\d+)\+(?P<Y>-?\d+)"
-    match: Match[str] | None = re.search(pattern, geometry)
-
-    if match is None:
+    match = _GEOMETRY_PATTERN.fullmatch(geometry.strip())
+    if match is None or not geometry.strip().lstrip("="):
         raise ValueError(f"Invalid geometry string format: {geometry!r}")
 
-    width = scale_func(match.group("W"))
-    height = scale_func(match.group("H"))
-    x = scale_func(match.group("X"))
-    y = scale_func(match.group("Y"))
+    def _int(group: str) -> int | None:
+        value = match.group(group)
+        return None if value is None else int(value)
 
-    return f"{width}x{height}+{x}+{y}"
+    return _Geometry(
+        width=_int("W"),
+        height=_int("H"),
+        x_sign=match.group("XS"),
+        x=_int("X"),
+        y_sign=match.group("YS"),
+        y=_int("Y"),
+    )
 
 
 class Tk(_TkBase):
@@ -95,10 +302,28 @@ class Tk(_TkBase):
     On non-Windows platforms, this class behaves identically to tkinter.Tk.
 
     Attributes:
+        dpi_info: The shared DpiInfo for the window's current DPI.
         dpi_x: Horizontal DPI value (96 = 100% scaling), or None on non-Windows.
         dpi_y: Vertical DPI value (96 = 100% scaling), or None on non-Windows.
         dpi_scaling: The scaling factor (1.0 = 100%, 1.5 = 150%, etc.).
 
+    When created with ``auto_scale=True``, ``geometry()``, ``minsize()`` and
+    ``maxsize()`` (and their ``wm_`` equivalents) take logical, unscaled
+    values and scale them automatically. Queries return logical values too,
+    so ``root.geometry(root.geometry())`` never scales twice.
+
+    The DPI is detected on first use, so applications that never scale
+    anything skip detection entirely. When created with
+    ``deferred_show=True``, the window starts withdrawn and is shown by
+    show(), which runs automatically when the event loop first goes idle.
+    Auto-scaled sizes set before then are applied together with the rest
+    of the layout, so the first frame is already laid out at the final
+    scaled size.
+
+    Widget options written with defer_configure() are coalesced, keeping
+    the last value per widget and option, and applied in a single Tcl call
+    when the event loop goes idle.
+
     Example:
         >>> from tkinter_unblur import Tk
         >>> root = Tk()
@@ -107,10 +332,6 @@ class Tk(_TkBase):
         >>> root.mainloop()
     """
 
-    dpi_x: int | None
-    dpi_y: int | None
-    dpi_scaling: float
-
     def __init__(
         self,
         screenName: str | None = None,
@@ -119,11 +340,40 @@ class Tk(_TkBase):
         useTk: bool = True,
         sync: bool = False,
         use: str | None = None,
+        auto_scale: bool = False,
+        deferred_show: bool = False,
     ) -> None:
         """Initialize a DPI-aware Tk window.
 
-        All arguments are passed directly to tkinter.Tk.__init__.
+        Args:
+            auto_scale: If True, window size calls take logical (unscaled)
+                values and are scaled automatically.
+            deferred_show: If True, the window stays withdrawn until show()
+                has applied the scaled layout.
+
+        All other arguments are passed directly to tkinter.Tk.__init__.
         """
+        self._auto_scale = auto_scale
+        self._logical_geometry: _Geometry | None = None
+        self._logical_minsize: tuple[int, int] | None = None
+        self._logical_maxsize: tuple[int, int] | None = None
+        self._logical_styles: dict[str, dict[str, dict[str, str]]] = {}
+        self._scaled_styles: dict[
+            tuple[str, DpiInfo], tuple[Any, dict[str, dict[str, str]]]
+        ] = {}
+        self._applied_styles: dict[str, dict[str, dict[str, str]]] = {}
+        self._option_defaults: dict[str, str] | None = None
+        self._default_font: str | tuple[Any, ...] | None = None
+        self._scaled_defaults: dict[DpiInfo, tuple[Any, ...]] = {}
+        self._dpi_waiters: list[asyncio.Future[DpiInfo]] = []
+        self._scaled_texts: weakref.WeakSet[ScaledText] = weakref.WeakSet()
+        self._dpi_info: DpiInfo | None = None
+        self._show_pending = False
+        self._deferred_configures: dict[str, dict[str, Any]] = {}
+        self._configure_after_id: str | None = None
+        self._deferred_commands: set[str] = set()
+        self._pending_configures = 0
+        self._merged_configures = 0
         super().__init__(
             screenName=screenName,
             baseName=baseName,
@@ -132,11 +382,466 @@ class Tk(_TkBase):
             sync=sync,
             use=use,
         )
-        self._apply_dpi_awareness()
+        # After the window exists, so Tk keeps its 96 DPI "tk scaling" and
+        # fonts are not scaled on top of the library's own font scaling
+        _enable_dpi_awareness()
+        if useTk:
+            self.tk.call(
+                "bind", _DPI_BINDTAG, "<Configure>", self.register(self._check_dpi)
+            )
+            self.bindtags((_DPI_BINDTAG, *self.bindtags()))
+        if deferred_show:
+            # Withdrawing before the event loop runs keeps the window unmapped
+            self.withdraw()
+            self._show_pending = True
+            self.after_idle(self.show)
 
     def _apply_dpi_awareness(self) -> None:
         """Apply DPI awareness settings to this window."""
-        self.dpi_x, self.dpi_y, self.dpi_scaling = _get_dpi_info(self.winfo_id())
+        self._dpi_info = _get_dpi_info(self.winfo_id())
+
+    @property
+    def dpi_info(self) -> DpiInfo:
+        """The shared DpiInfo for the window's DPI, detected on first use."""
+        info = self._dpi_info
+        if info is None:
+            info = self._dpi_info = _get_dpi_info(self.winfo_id())
+        return info
+
+    @property
+    def dpi_x(self) -> int | None:
+        """Horizontal DPI value (96 = 100% scaling), or None on non-Windows."""
+        return self.dpi_info.dpi_x
+
+    @property
+    def dpi_y(self) -> int | None:
+        """Vertical DPI value (96 = 100% scaling), or None on non-Windows."""
+        return self.dpi_info.dpi_y
+
+    @property
+    def dpi_scaling(self) -> float:
+        """The scaling factor (1.0 = 100%, 1.5 = 150%, etc.)."""
+        return self.dpi_info.scaling
+
+    def scale_context(self) -> DpiInfo:
+        """Return the current DpiInfo, which is safe to share with threads.
+
+        Equivalent to the dpi_info attribute.
+        """
+        return self.dpi_info
+
+    def _check_dpi(self) -> None:
+        """Check for a DPI change after the window was moved or resized."""
+        # Nothing was scaled before the first detection, so keep it lazy
+        if self._dpi_info is not None:
+            self.update_dpi()
+
+    def update_dpi(self) -> bool:
+        """Re-detect the DPI, e.g. after the window moved to another monitor.
+
+        This runs automatically whenever the window is moved or resized,
+        once the DPI has been used. Unchanged DPI costs one detection and an
+        identity check. Call it directly after other changes, such as new
+        display settings.
+
+        In auto-scale mode, the window's current size is rescaled from the
+        previous DPI, keeping any resizing by the user, and the logical
+        minimum and maximum sizes are re-applied. The position is kept. When the
+        DPI changed, ScaledText widgets are rescaled, a ``<<DpiChanged>>``
+        virtual event is generated and coroutines awaiting
+        wait_for_dpi_change() are woken.
+
+        Returns:
+            True if the DPI changed, False otherwise.
+        """
+        previous = self._dpi_info
+        self._apply_dpi_awareness()
+        if previous is None or self.dpi_info is previous:
+            # Nothing was scaled before the first detection
+            return False
+        if self._auto_scale and not self._show_pending:
+            self._rescale_window(previous)
+        for theme in self._logical_styles:
+            self._apply_styles(theme)
+        if self._option_defaults is not None:
+            self.install_scaled_defaults()
+        for text in tuple(self._scaled_texts):
+            text.rescale()
+        waiters, self._dpi_waiters = self._dpi_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(self.dpi_info)
+        self.event_generate("<<DpiChanged>>")
+        return True
+
+    def show(self) -> None:
+        """Lay out and map a window created with ``deferred_show=True``.
+
+        Pending auto-scaled sizes are applied and all geometry is computed
+        while the window is still withdrawn, followed by a single deiconify.
+        This runs automatically when the event loop first goes idle; calling
+        it earlier is allowed, and calling it again has no effect.
+        """
+        if not self._show_pending:
+            return
+        self._show_pending = False
+        if self._auto_scale:
+            self._reapply_auto_scale()
+        self.update_idletasks()
+        self.deiconify()
+
+    async def wait_for_dpi_change(self) -> DpiInfo:
+        """Wait until update_dpi() detects a DPI change.
+
+        update_dpi() runs automatically when the window is moved or
+        resized, e.g. onto another monitor. The event loop must keep
+        processing Tk events, e.g. with tkinter_unblur.aio.mainloop().
+
+        Returns:
+            The DpiInfo for the new DPI.
+
+        Example:
+            >>> info = await root.wait_for_dpi_change()
+            >>> print(f"Now at {info.scaling:.0%}")
+        """
+        import asyncio
+
+        # Detect the current DPI, as changes are only seen once it is known
+        self.dpi_info  # noqa: B018
+        waiter: asyncio.Future[DpiInfo] = asyncio.get_running_loop().create_future()
+        self._dpi_waiters.append(waiter)
+        try:
+            return await waiter
+        finally:
+            if waiter in self._dpi_waiters:
+                self._dpi_waiters.remove(waiter)
+
+    def install_scaled_defaults(
+        self, font: str | tuple[Any, ...] | None = None
+    ) -> None:
+        """Write DPI-scaled widget defaults into Tk's option database.
+
+        Padding, border widths, highlight thicknesses and similar pixel
+        defaults of the standard (non-ttk) widget classes are scaled, so
+        widgets created afterwards need no per-widget scaling. The built-in
+        defaults are read once, and the scaled values are written in a
+        single batch and cached per DPI. update_dpi() rewrites them when
+        the DPI changes; existing widgets keep their values.
+
+        The defaults are added at "startupFile" priority, so options the
+        application adds itself with option_add() take precedence.
+
+        Args:
+            font: A logical font description, e.g. ("Segoe UI", 9), to
+                install as the default "*font" with its size scaled.
+                Defaults to the font from a previous call, if any.
+
+        Example:
+            >>> root = Tk()
+            >>> root.install_scaled_defaults(font=("Segoe UI", 9))
+            >>> Button(root, text="OK")  # padx, borderwidth, font scaled
+        """
+        if font is not None and font != self._default_font:
+            self._default_font = font
+            self._scaled_defaults.clear()
+        if self._option_defaults is None:
+            self._option_defaults = _options.read_defaults(self.tk)
+        settings = self._scaled_defaults.get(self.dpi_info)
+        if settings is None:
+            settings = _options.scale_defaults(self._option_defaults, self.scale_value)
+            if self._default_font is not None:
+                scaled_font = _styles.scale_font(
+                    self.tk, self._default_font, self.scale_value
+                )
+                if scaled_font is not None:
+                    settings += ("*font", scaled_font)
+            self._scaled_defaults[self.dpi_info] = settings
+        _options.apply_defaults(self.tk, settings)
+
+    def scale_styles(self, theme: str | None = None) -> None:
+        """Scale the pixel-valued options and fonts of all ttk styles in a theme.
+
+        Each call re-reads the theme's style database, so styles configured
+        since the previous call are scaled too. Values this method scaled
+        itself keep their logical values, so calling it again never scales
+        twice. update_dpi() rescales the theme from the logical values,
+        with the scaled settings cached per theme and DPI. Call this method
+        again after configuring styles, or the next DPI change overwrites
+        the new values.
+
+        Args:
+            theme: The theme to scale. Defaults to the theme in use.
+
+        Example:
+            >>> root = Tk()
+            >>> ttk.Style().configure("Big.TButton", padding=10)
+            >>> root.scale_styles()  # padding becomes 15 at 150%
+        """
+        if theme is None:
+            theme = str(self.tk.call("ttk::style", "theme", "use"))
+        logical = _styles.merge_styles(
+            _styles.read_styles(self.tk, theme),
+            self._logical_styles.get(theme, {}),
+            self._applied_styles.get(theme, {}),
+        )
+        if logical != self._logical_styles.get(theme):
+            self._logical_styles[theme] = logical
+            for key in [key for key in self._scaled_styles if key[0] == theme]:
+                del self._scaled_styles[key]
+        self._apply_styles(theme)
+
+    def _apply_styles(self, theme: str) -> None:
+        """Apply the logical styles of a theme at the current DPI."""
+        key = (theme, self.dpi_info)
+        cached = self._scaled_styles.get(key)
+        if cached is None:
+            settings = _styles.scale_styles(
+                self.tk, self._logical_styles[theme], self.scale_value
+            )
+            _styles.apply_styles(self.tk, theme, settings)
+            # Read back as Tk formats them, to recognize them in scale_styles()
+            cached = (settings, _styles.read_styles(self.tk, theme))
+            self._scaled_styles[key] = cached
+        else:
+            _styles.apply_styles(self.tk, theme, cached[0])
+        self._applied_styles[theme] = cached[1]
+
+    @property
+    def pending_configures(self) -> int:
+        """The number of deferred configure writes waiting to be applied."""
+        return self._pending_configures
+
+    @property
+    def merged_configures(self) -> int:
+        """The number of deferred configure writes replaced by a later one."""
+        return self._merged_configures
+
+    def defer_configure(self, widget: Misc, option: str, value: Any) -> None:
+        """Queue a widget option write, applied when the event loop goes idle.
+
+        Writes to the same widget and option before the next flush are
+        merged, keeping the last value, and all pending writes are applied
+        by flush_configures() in a single Tcl call. This makes bursts of
+        updates, e.g. during a resize, cost one Tcl round trip per frame.
+
+        Values go to Tk as given, bypassing Python configure() overrides
+        such as ScaledText's scaling. Errors, such as unknown options, are
+        raised by the flush, and writes to widgets destroyed in the meantime
+        are dropped.
+
+        Args:
+            widget: The widget to configure.
+            option: The option name, e.g. "text". A trailing underscore is
+                removed, as with configure().
+            value: The option value. Callables are registered as commands,
+                and the command of a replaced write is deleted. None values
+                are ignored, as with configure().
+
+        Example:
+            >>> for i in range(1000):
+            ...     root.defer_configure(label, "text", f"{i} items")
+            >>> root.merged_configures
+            999
+        """
+        if value is None:
+            return
+        if option.endswith("_"):
+            option = option[:-1]
+        if callable(value):
+            value = widget.register(value)
+            self._deferred_commands.add(value)
+        options = self._deferred_configures.setdefault(str(widget), {})
+        if option in options:
+            self._merged_configures += 1
+            replaced = options[option]
+            if isinstance(replaced, str) and replaced in self._deferred_commands:
+                self._deferred_commands.remove(replaced)
+                widget.deletecommand(replaced)
+        else:
+            self._pending_configures += 1
+        options[option] = value
+        if self._configure_after_id is None:
+            self._configure_after_id = self.after_idle(self.flush_configures)
+
+    def flush_configures(self) -> int:
+        """Apply all deferred configure writes now, in a single Tcl call.
+
+        This runs automatically when the event loop goes idle after
+        defer_configure().
+
+        Returns:
+            The number of writes applied.
+
+        Raises:
+            TclError: If any write failed. The other writes are applied.
+        """
+        if self._configure_after_id is not None:
+            self.after_cancel(self._configure_after_id)
+            self._configure_after_id = None
+        deferred, self._deferred_configures = self._deferred_configures, {}
+        # Applied commands now belong to their widgets, as with configure()
+        self._deferred_commands.clear()
+        count, self._pending_configures = self._pending_configures, 0
+        if not deferred:
+            return 0
+        writes = tuple(
+            item
+            for widget, options in deferred.items()
+            for item in (
+                widget,
+                tuple(
+                    part
+                    for option, value in options.items()
+                    for part in (f"-{option}", value)
+                ),
+            )
+        )
+        errors = self.tk.splitlist(self.tk.call("apply", _CONFIGURE_SCRIPT, writes))
+        logger.debug(f"Flushed {count} configure writes to {len(deferred)} widgets")
+        if errors:
+            raise TclError("; ".join(map(str, errors)))
+        return count
+
+    def _reapply_auto_scale(self) -> None:
+        """Re-apply the stored logical window sizes at the current scaling."""
+        if self._logical_geometry is not None:
+            self.tk.call(
+                "wm",
+                "geometry",
+                str(self),
+                self._logical_geometry.format(self.scale_value),
+            )
+        for command, size in (
+            ("minsize", self._logical_minsize),
+            ("maxsize", self._logical_maxsize),
+        ):
+            if size is not None:
+                self.tk.call("wm", command, str(self), *map(self.scale_value, size))
+
+    def _rescale_window(self, previous: DpiInfo) -> None:
+        """Rescale the window's current size after a DPI change.
+
+        The current size, including any resizing by the user, is converted
+        to logical units at the previous DPI and applied at the new one.
+        The position is left alone, as the window may have been moved to
+        another monitor. Minimum and maximum sizes are re-applied first, so
+        they do not clamp the new size.
+        """
+        for command, size in (
+            ("minsize", self._logical_minsize),
+            ("maxsize", self._logical_maxsize),
+        ):
+            if size is not None:
+                self.tk.call("wm", command, str(self), *map(self.scale_value, size))
+        if self._logical_geometry is None or self._logical_geometry.width is None:
+            return  # The window keeps its natural size
+        current = _parse_geometry(self.tk.call("wm", "geometry", str(self)))
+        if current.width is None or current.height is None:
+            return
+        logical = _Geometry(
+            previous.unscale_value(current.width),
+            previous.unscale_value(current.height),
+            None,
+            None,
+            None,
+            None,
+        )
+        self._logical_geometry = self._logical_geometry.update(logical)
+        self.tk.call("wm", "geometry", str(self), logical.format(self.scale_value))
+
+    @overload
+    def wm_geometry(self, newGeometry: None = None) -> str: ...
+    @overload
+    def wm_geometry(self, newGeometry: str) -> None: ...
+
+    def wm_geometry(self, newGeometry: str | None = None) -> str | None:
+        """Set or query the window geometry.
+
+        In auto-scale mode, newGeometry is given in logical units and the
+        query result is converted back to logical units.
+        """
+        if not self._auto_scale:
+            return self.tk.call("wm", "geometry", str(self), newGeometry)  # type: ignore[no-any-return]
+        if newGeometry is None:
+            current = _parse_geometry(self.tk.call("wm", "geometry", str(self)))
+            return current.format(self.unscale_value)
+        if not newGeometry:
+            # An empty geometry reverts to the natural size
+            self._logical_geometry = None
+            scaled: str = newGeometry
+        else:
+            parsed = _parse_geometry(newGeometry)
+            if self._logical_geometry is not None:
+                self._logical_geometry = self._logical_geometry.update(parsed)
+            else:
+                self._logical_geometry = parsed
+            if self._show_pending:
+                # Applied by show() together with the rest of the layout
+                return None
+            scaled = parsed.format(self.scale_value)
+        self.tk.call("wm", "geometry", str(self), scaled)
+        return None
+
+    geometry = wm_geometry
+
+    def _wm_size(
+        self, command: str, width: int | None, height: int | None
+    ) -> tuple[int, int] | None:
+        """Set or query "wm minsize" or "wm maxsize", scaling in auto-scale mode."""
+        if width is None and height is None:
+            result = self.tk.call("wm", command, str(self))
+            width, height = map(self.tk.getint, self.tk.splitlist(result))
+            if not self._auto_scale:
+                return width, height
+            return self.unscale_value(width), self.unscale_value(height)
+        if self._auto_scale:
+            size = (int(width or 0), int(height or 0))
+            if command == "minsize":
+                self._logical_minsize = size
+            else:
+                self._logical_maxsize = size
+            if self._show_pending:
+                # Applied by show() together with the rest of the layout
+                return None
+            width, height = map(self.scale_value, size)
+        self.tk.call("wm", command, str(self), width, height)
+        return None
+
+    @overload
+    def wm_minsize(
+        self, width: None = None, height: None = None
+    ) -> tuple[int, int]: ...
+    @overload
+    def wm_minsize(self, width: int, height: int) -> None: ...
+
+    def wm_minsize(
+        self, width: int | None = None, height: int | None = None
+    ) -> tuple[int, int] | None:
+        """Set or query the minimum window size.
+
+        In auto-scale mode, sizes are given and returned in logical units.
+        """
+        return self._wm_size("minsize", width, height)
+
+    minsize = wm_minsize
+
+    @overload
+    def wm_maxsize(
+        self, width: None = None, height: None = None
+    ) -> tuple[int, int]: ...
+    @overload
+    def wm_maxsize(self, width: int, height: int) -> None: ...
+
+    def wm_maxsize(
+        self, width: int | None = None, height: int | None = None
+    ) -> tuple[int, int] | None:
+        """Set or query the maximum window size.
+
+        In auto-scale mode, sizes are given and returned in logical units.
+        """
+        return self._wm_size("maxsize", width, height)
+
+    maxsize = wm_maxsize
 
     def scale_value(self, value: float | str) -> int:
         """Scale a value according to the current DPI scaling factor.
@@ -152,13 +857,14 @@ class Tk(_TkBase):
             >>> root.scale_value(100)
             150
         """
-        return int(float(value) * self.dpi_scaling)
+        return self.dpi_info.scale_value(value)
 
     def scale_geometry(self, geometry: str) -> str:
         """Scale a geometry string according to the current DPI scaling factor.
 
         Args:
-            geometry: A Tkinter geometry string in format "WxH+X+Y".
+            geometry: A Tkinter geometry string in any form accepted by
+                "wm geometry", e.g. "WxH+X+Y", "WxH" or "WxH-X-Y".
 
         Returns:
             The scaled geometry string.
@@ -168,7 +874,40 @@ class Tk(_TkBase):
             >>> root.scale_geometry("800x600+100+50")
             "1200x900+150+75"
         """
-        return _scale_geometry(geometry, self.scale_value)
+        return self.dpi_info.scale_geometry(geometry)
+
+    def unscale_value(self, value: float | str) -> int:
+        """Convert a scaled value, such as an event coordinate, to logical units.
+
+        Args:
+            value: The scaled value (can be int, float, or numeric string).
+
+        Returns:
+            The logical value, rounded to the nearest integer.
+
+        Example:
+            >>> root = Tk()  # On a 150% scaled display
+            >>> root.unscale_value(150)
+            100
+        """
+        return self.dpi_info.unscale_value(value)
+
+    def unscale_geometry(self, geometry: str) -> str:
+        """Convert a scaled geometry string back to logical units.
+
+        Args:
+            geometry: A Tkinter geometry string in any form accepted by
+                "wm geometry", e.g. "WxH+X+Y", "WxH" or "WxH-X-Y".
+
+        Returns:
+            The logical geometry string.
+
+        Example:
+            >>> root = Tk()  # On a 150% scaled display
+            >>> root.unscale_geometry("1200x900+150+75")
+            "800x600+100+50"
+        """
+        return self.dpi_info.unscale_geometry(geometry)
 
 
 # Backwards compatibility alias
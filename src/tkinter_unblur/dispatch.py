@@ -0,0 +1,112 @@
+"""Batched marshalling of UI updates from worker threads to the Tk thread.
+
+Tkinter objects may only be used from the thread that created them. Worker
+threads submit callables to an UpdateDispatcher, which runs everything
+submitted since the last frame in a single after() callback on the Tk
+thread.
+
+Example:
+    >>> root = Tk()
+    >>> dispatcher = UpdateDispatcher(root)
+    >>> dispatcher.start()
+    >>> # From any thread:
+    >>> dispatcher.submit(label.configure, text="Done")
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sys
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from tkinter import Tk
+
+__all__ = ["UpdateDispatcher"]
+
+logger = logging.getLogger(__name__)
+
+
+class UpdateDispatcher:
+    """Collects UI updates from many threads and applies them once per frame.
+
+    submit() may be called from any thread. All other methods must be called
+    on the Tk thread.
+
+    Attributes:
+        interval: The frame interval in milliseconds.
+    """
+
+    def __init__(self, root: Tk, interval: int = 16) -> None:
+        """Create a dispatcher for a Tk window.
+
+        Args:
+            root: The Tk window whose thread runs the updates.
+            interval: The frame interval in milliseconds.
+        """
+        self.interval = interval
+        self._root = root
+        self._queue: queue.SimpleQueue[
+            tuple[Callable[..., object], tuple[Any, ...], dict[str, Any]]
+        ] = queue.SimpleQueue()
+        self._after_id: str | None = None
+
+    @property
+    def pending(self) -> int:
+        """The approximate number of updates waiting for the next flush."""
+        return self._queue.qsize()
+
+    @property
+    def running(self) -> bool:
+        """Whether the dispatcher is flushing updates every frame."""
+        return self._after_id is not None
+
+    def submit(self, func: Callable[..., object], *args: Any, **kwargs: Any) -> None:
+        """Queue func(*args, **kwargs) to run on the Tk thread.
+
+        This method is thread-safe and never touches Tcl.
+        """
+        self._queue.put((func, args, kwargs))
+
+    def start(self) -> None:
+        """Start flushing queued updates every frame."""
+        if self._after_id is None:
+            self._after_id = self._root.after(self.interval, self._tick)
+
+    def stop(self) -> None:
+        """Stop flushing. Queued updates are kept until the next flush."""
+        if self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def flush(self) -> int:
+        """Run the updates queued so far on the calling (Tk) thread.
+
+        Updates submitted while flushing wait for the next flush, so busy
+        producers cannot stall the event loop. Exceptions are reported
+        through the window's report_callback_exception() and do not stop
+        the remaining updates.
+
+        Returns:
+            The number of updates run.
+        """
+        count = 0
+        for _ in range(self._queue.qsize()):
+            try:
+                func, args, kwargs = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            count += 1
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                self._root.report_callback_exception(*sys.exc_info())
+        if count:
+            logger.debug(f"Flushed {count} queued updates")
+        return count
+
+    def _tick(self) -> None:
+        """Flush queued updates and schedule the next frame."""
+        self._after_id = self._root.after(self.interval, self._tick)
+        self.flush()
@@ -0,0 +1,225 @@
+"""DPI-aware Text widget with bulk rescaling of tags, tabs and spacing.
+
+Text tags carry fonts, line spacing, margins and tab stops in pixels, none
+of which Tk scales by itself. ScaledText records the logical values given
+to configure() and tag_configure(), and rescales the widget and all of its
+tags in a single Tcl call whenever the DPI changes. The cost depends on the
+number of tags, not on the size of the document.
+
+Example:
+    >>> from tkinter_unblur import Tk
+    >>> from tkinter_unblur.text import ScaledText
+    >>> root = Tk()
+    >>> log = ScaledText(root, spacing1=2, tabs=(40, 80))
+    >>> log.tag_configure("error", font=("Consolas", 10), lmargin1=16)
+"""
+
+from __future__ import annotations
+
+import logging
+import tkinter
+from typing import Any
+
+from tkinter_unblur import _styles
+from tkinter_unblur.core import DpiInfo, Tk
+
+__all__ = ["ScaledText"]
+
+logger = logging.getLogger(__name__)
+
+# Widget options whose values are screen distances in pixels
+WIDGET_PIXEL_OPTIONS = frozenset(
+    {
+        "borderwidth",
+        "highlightthickness",
+        "insertwidth",
+        "padx",
+        "pady",
+        "selectborderwidth",
+        "spacing1",
+        "spacing2",
+        "spacing3",
+    }
+)
+
+# Tag options whose values are screen distances in pixels
+TAG_PIXEL_OPTIONS = frozenset(
+    {
+        "borderwidth",
+        "lmargin1",
+        "lmargin2",
+        "offset",
+        "rmargin",
+        "spacing1",
+        "spacing2",
+        "spacing3",
+    }
+)
+
+# Rescales the widget and all tags from flat option lists in one call
+_RESCALE_SCRIPT = """{widget options tags} {
+    if {[llength $options]} {
+        $widget configure {*}$options
+    }
+    foreach {tag tag_options} $tags {
+        $widget tag configure $tag {*}$tag_options
+    }
+}"""
+
+
+class ScaledText(tkinter.Text):
+    """A Text widget whose pixel options, tag options and fonts follow the DPI.
+
+    Pixel values and font sizes passed to the constructor, configure() and
+    tag_configure() are logical (100%) values. They are scaled for the
+    window's current DPI and rescaled in bulk by rescale(), which runs
+    automatically when the update_dpi() of a tkinter_unblur.Tk root detects
+    a DPI change. Distances with units such as "1c" and named fonts are passed
+    through unchanged.
+
+    Queries return the scaled values Tk is using.
+    """
+
+    def __init__(
+        self,
+        master: tkinter.Misc | None = None,
+        cnf: dict[str, Any] | None = None,
+        **kw: Any,
+    ) -> None:
+        """Create a ScaledText widget.
+
+        All arguments are passed to tkinter.Text, after scaling pixel
+        options and fonts.
+        """
+        self._logical_options: dict[str, Any] = {}
+        self._logical_tags: dict[str, dict[str, Any]] = {}
+        options = {**(cnf or {}), **kw}
+        # The widget name is only accepted at creation
+        name = {"name": options.pop("name")} if "name" in options else {}
+        super().__init__(master, **name)
+        if options:
+            self.configure(options)
+        root = self.nametowidget(".")
+        if isinstance(root, Tk):
+            root._scaled_texts.add(self)
+
+    def _dpi_info(self) -> DpiInfo:
+        """Return the DPI information of the root window."""
+        root = self.nametowidget(".")
+        if isinstance(root, Tk):
+            return root.dpi_info
+        return DpiInfo(None, None)
+
+    def _scale_option(self, option: str, value: Any, dpi_info: DpiInfo) -> Any:
+        """Return the scaled value of an option, or None if it does not scale."""
+        if option == "font":
+            if not isinstance(value, (str, tuple, list)):
+                return None  # Font objects are named fonts
+            return _styles.scale_font(
+                self.tk,
+                tuple(value) if isinstance(value, list) else value,
+                dpi_info.scale_value,
+            )
+        if option == "tabs":
+            # Tab stops mix distances with alignment keywords
+            scaled = []
+            for part in self.tk.splitlist(value):
+                try:
+                    scaled.append(dpi_info.scale_value(int(part)))
+                except ValueError:
+                    if part not in ("left", "right", "center", "numeric"):
+                        return None
+                    scaled.append(part)
+            return tuple(scaled)
+        try:
+            return dpi_info.scale_value(int(value))
+        except (TypeError, ValueError):
+            return None
+
+    def _scale_options(
+        self,
+        options: dict[str, Any],
+        pixel_options: frozenset[str],
+        logical: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Record the logical values of scalable options and scale them."""
+        dpi_info = self._dpi_info()
+        scaled = {}
+        for option, value in options.items():
+            option = option.rstrip("_")
+            new_value = None
+            if option in pixel_options or option in ("font", "tabs"):
+                new_value = self._scale_option(option, value, dpi_info)
+            if new_value is None:
+                logical.pop(option, None)
+                scaled[option] = value
+            else:
+                logical[option] = value
+                scaled[option] = new_value
+        return scaled
+
+    def configure(  # type: ignore[override]
+        self, cnf: dict[str, Any] | str | None = None, **kw: Any
+    ) -> Any:
+        """Configure the widget, taking logical pixel values and fonts."""
+        if isinstance(cnf, str) or (not cnf and not kw):
+            return super().configure(cnf)
+        options = self._scale_options(
+            {**(cnf or {}), **kw}, WIDGET_PIXEL_OPTIONS, self._logical_options
+        )
+        return super().configure(options)
+
+    config = configure  # type: ignore[assignment]
+
+    def tag_configure(  # type: ignore[override]
+        self, tagName: str, cnf: dict[str, Any] | str | None = None, **kw: Any
+    ) -> Any:
+        """Configure a tag, taking logical pixel values and fonts."""
+        if isinstance(cnf, str) or (not cnf and not kw):
+            return super().tag_configure(tagName, cnf)
+        logical = self._logical_tags.setdefault(tagName, {})
+        options = self._scale_options({**(cnf or {}), **kw}, TAG_PIXEL_OPTIONS, logical)
+        if not logical:
+            del self._logical_tags[tagName]
+        return super().tag_configure(tagName, options)
+
+    tag_config = tag_configure  # type: ignore[assignment]
+
+    def tag_delete(self, first: str, *tagNames: str) -> None:
+        """Delete tags and their recorded logical values."""
+        for tag in (first, *tagNames):
+            self._logical_tags.pop(tag, None)
+        super().tag_delete(first, *tagNames)
+
+    def rescale(self) -> None:
+        """Rescale the widget and all tags for the current DPI in one Tcl call.
+
+        This runs automatically when the update_dpi() of a tkinter_unblur.Tk
+        root detects a DPI change. Its cost depends on the number of tags, not on
+        the size of the document.
+        """
+        dpi_info = self._dpi_info()
+
+        def flatten(options: dict[str, Any]) -> tuple[Any, ...]:
+            return tuple(
+                item
+                for option, value in options.items()
+                for item in (f"-{option}", self._scale_option(option, value, dpi_info))
+            )
+
+        tags = tuple(
+            item
+            for tag, options in self._logical_tags.items()
+            for item in (tag, flatten(options))
+        )
+        self.tk.call(
+            "apply", _RESCALE_SCRIPT, str(self), flatten(self._logical_options), tags
+        )
+        logger.debug(f"Rescaled {len(self._logical_tags)} tags at {dpi_info}")
+
+    def destroy(self) -> None:
+        """Destroy the widget and stop rescaling it on DPI changes."""
+        root = self.nametowidget(".")
+        if isinstance(root, Tk):
+            root._scaled_texts.discard(self)
+        super().destroy()
@@ -0,0 +1,98 @@
+"""Tests for tkinter_unblur.aio module."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+
+import pytest
+
+# Check if tkinter is available
+try:
+    import tkinter
+
+    TKINTER_AVAILABLE = True
+except ImportError:
+    TKINTER_AVAILABLE = False
+
+# Skip entire module if tkinter is not available
+pytestmark = pytest.mark.skipif(not TKINTER_AVAILABLE, reason="tkinter not available")
+
+if TKINTER_AVAILABLE:
+    from tkinter_unblur import aio
+
+
+@pytest.fixture
+def interp():
+    """A Tcl interpreter whose "window" exists until ::alive is cleared."""
+    interp = tkinter.Tcl()
+    interp.tk.eval("set ::alive 1; proc winfo {cmd window} {return $::alive}")
+    yield interp
+    # Free the interpreter on this thread. If a reference cycle kept it
+    # alive, a later collection on another thread would make Tcl abort.
+    interp.tk.eval("proc destroy {args} {}")
+    interp.destroy()
+    gc.collect()
+
+
+class TestMainloop:
+    """Tests for the asyncio mainloop driver."""
+
+    def test_mainloop_returns_when_window_destroyed(self, interp) -> None:
+        """The driver exits once the window no longer exists."""
+        interp.after(20, lambda: interp.tk.eval("set ::alive 0"))
+        asyncio.run(asyncio.wait_for(aio.mainloop(interp), timeout=5))
+
+    def test_tk_events_and_tasks_interleave(self, interp) -> None:
+        """Tk callbacks and asyncio tasks both make progress."""
+        ticks: list[str] = []
+
+        def tk_tick() -> None:
+            ticks.append("tk")
+            if ticks.count("tk") < 5:
+                interp.after(5, tk_tick)
+
+        async def asyncio_ticks() -> None:
+            for _ in range(5):
+                ticks.append("asyncio")
+                await asyncio.sleep(0.005)
+            while ticks.count("tk") < 5:
+                await asyncio.sleep(0.005)
+            interp.tk.eval("set ::alive 0")
+
+        async def main() -> None:
+            interp.after(5, tk_tick)
+            await asyncio.gather(aio.mainloop(interp), asyncio_ticks())
+
+        asyncio.run(asyncio.wait_for(main(), timeout=5))
+        assert ticks.count("tk") == 5
+        assert ticks.count("asyncio") == 5
+
+    def test_idle_polling_backs_off(self, interp) -> None:
+        """An idle window is polled at most about every max_interval."""
+        polls = 0
+        dooneevent = interp.tk.dooneevent
+
+        class CountingApp:
+            def __getattr__(self, name: str):
+                return getattr(interp.tk, name)
+
+            def dooneevent(self, flags: int) -> int:
+                nonlocal polls
+                polls += 1
+                return dooneevent(flags)
+
+        class Window:
+            tk = CountingApp()
+
+            def winfo_exists(self) -> bool:
+                return interp.tk.eval("set ::alive") == "1"
+
+        interp.after(300, lambda: interp.tk.eval("set ::alive 0"))
+        start = time.perf_counter()
+        asyncio.run(aio.mainloop(Window(), max_interval=0.02))  # type: ignore[arg-type]
+        elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.3
+        assert polls < elapsed / 0.02 + 20
@@ -0,0 +1,183 @@
+"""Tests for pre-rendered image assets."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from tkinter_unblur.__main__ import main
+from tkinter_unblur.assets import (
+    MANIFEST_NAME,
+    AssetLoader,
+    load_manifest,
+    prerender,
+    variant_name,
+)
+
+
+def _write_image(path: Path, size: tuple[int, int] = (16, 8)) -> None:
+    """Write a small RGBA image."""
+    image_module = pytest.importorskip("PIL.Image")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    image_module.new("RGBA", size, (255, 0, 0, 128)).save(path)
+
+
+class TestVariantName:
+    """Tests for variant_name."""
+
+    def test_variant_name(self) -> None:
+        """Test that the scale is appended to the stem."""
+        assert variant_name("save.png", 1.5) == "save@1.5x.png"
+        assert variant_name("icons/save.gif", 2.0) == "icons/save@2x.gif"
+
+
+class TestLoadManifest:
+    """Tests for load_manifest."""
+
+    def test_missing_manifest_is_empty(self, tmp_path: Path) -> None:
+        """Test that a missing manifest has no assets."""
+        assert load_manifest(tmp_path)["assets"] == {}
+
+    def test_invalid_manifest_is_empty(self, tmp_path: Path) -> None:
+        """Test that an unreadable manifest has no assets."""
+        (tmp_path / MANIFEST_NAME).write_text("{", encoding="utf-8")
+        assert load_manifest(tmp_path)["assets"] == {}
+
+
+class TestPrerender:
+    """Tests for prerender."""
+
+    def test_renders_variants(self, tmp_path: Path) -> None:
+        """Test that every scale is rendered with the scaled size."""
+        image_module = pytest.importorskip("PIL.Image")
+        _write_image(tmp_path / "icons" / "save.png")
+        _write_image(tmp_path / "spinner.gif")
+
+        result = prerender(tmp_path, scales=(1.25, 2.0), workers=2)
+
+        assert sorted(result.rendered) == ["icons/save.png", "spinner.gif"]
+        with image_module.open(tmp_path / "icons" / "save@1.25x.png") as image:
+            assert image.size == (20, 10)
+        with image_module.open(tmp_path / "spinner@2x.gif") as image:
+            assert image.size == (32, 16)
+        entry = load_manifest(tmp_path)["assets"]["icons/save.png"]
+        assert entry["size"] == [16, 8]
+        assert entry["variants"] == {
+            "1.25": "icons/save@1.25x.png",
+            "2": "icons/save@2x.png",
+        }
+
+    def test_skips_unchanged_assets(self, tmp_path: Path) -> None:
+        """Test that only changed assets are rendered again."""
+        _write_image(tmp_path / "a.png")
+        _write_image(tmp_path / "b.png")
+        prerender(tmp_path, scales=(1.5,), workers=1)
+
+        _write_image(tmp_path / "b.png", size=(10, 10))
+        result = prerender(tmp_path, scales=(1.5,), workers=1)
+
+        assert result.rendered == ("b.png",)
+        assert result.skipped == ("a.png",)
+        assert load_manifest(tmp_path)["assets"]["b.png"]["size"] == [10, 10]
+
+    def test_renders_missing_variants(self, tmp_path: Path) -> None:
+        """Test that deleted variants and new scales are rendered again."""
+        _write_image(tmp_path / "a.png")
+        prerender(tmp_path, scales=(1.5,), workers=1)
+        (tmp_path / "a@1.5x.png").unlink()
+
+        assert prerender(tmp_path, scales=(1.5,), workers=1).rendered == ("a.png",)
+        assert prerender(tmp_path, scales=(2.0,), workers=1).rendered == ("a.png",)
+
+    def test_removed_assets_leave_manifest(self, tmp_path: Path) -> None:
+        """Test that the manifest only lists existing assets."""
+        _write_image(tmp_path / "a.png")
+        prerender(tmp_path, scales=(1.5,), workers=1)
+        (tmp_path / "a.png").unlink()
+
+        prerender(tmp_path, scales=(1.5,), workers=1)
+
+        assert load_manifest(tmp_path)["assets"] == {}
+
+    def test_corrupt_asset_does_not_abort(self, tmp_path: Path) -> None:
+        """Test that a corrupt image is reported and the others are recorded."""
+        _write_image(tmp_path / "a.png")
+        _write_image(tmp_path / "c.png")
+        (tmp_path / "b.png").write_bytes(b"not an image")
+
+        result = prerender(tmp_path, scales=(1.5,), workers=2)
+
+        assert result.rendered == ("a.png", "c.png")
+        assert result.failed == ("b.png",)
+        assert sorted(load_manifest(tmp_path)["assets"]) == ["a.png", "c.png"]
+        result = prerender(tmp_path, scales=(1.5,), workers=2)
+        assert result.skipped == ("a.png", "c.png")
+        assert result.failed == ("b.png",)
+
+    def test_cli(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test the prerender command."""
+        _write_image(tmp_path / "a.png")
+
+        status = main(["prerender", str(tmp_path), "--scales", "2", "--workers", "1"])
+
+        assert status == 0
+        assert (tmp_path / "a@2x.png").is_file()
+        assert "1 rendered, 0 unchanged, 0 failed" in capsys.readouterr().out
+
+    def test_cli_reports_failures(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that the prerender command reports failed assets."""
+        _write_image(tmp_path / "a.png")
+        (tmp_path / "b.png").write_bytes(b"not an image")
+
+        status = main(["prerender", str(tmp_path), "--scales", "2", "--workers", "1"])
+
+        output = capsys.readouterr()
+        assert status == 1
+        assert "error: cannot render b.png" in output.err
+        assert "1 rendered, 0 unchanged, 1 failed" in output.out
+
+
+class TestAssetLoader:
+    """Tests for AssetLoader variant selection."""
+
+    @pytest.fixture
+    def loader(self, tmp_path: Path) -> AssetLoader:
+        manifest = {
+            "version": 1,
+            "assets": {
+                "save.png": {
+                    "sha256": "",
+                    "size": [16, 16],
+                    "variants": {"1.5": "save@1.5x.png", "2": "save@2x.png"},
+                }
+            },
+        }
+        (tmp_path / MANIFEST_NAME).write_text(json.dumps(manifest), encoding="utf-8")
+        return AssetLoader(tmp_path, Mock(dpi_scaling=1.5))
+
+    @pytest.mark.parametrize(
+        ("scaling", "expected"),
+        [
+            (1.0, "save.png"),
+            (1.25, "save@1.5x.png"),
+            (1.5, "save@1.5x.png"),
+            (1.75, "save@2x.png"),
+            (3.0, "save@2x.png"),
+        ],
+    )
+    def test_path(self, loader: AssetLoader, scaling: float, expected: str) -> None:
+        """Test that the closest variant is chosen, preferring larger ones."""
+        assert loader.path("save.png", scaling).name == expected
+
+    def test_path_defaults_to_window_scaling(self, loader: AssetLoader) -> None:
+        """Test that the window's scaling is used by default."""
+        assert loader.path("save.png").name == "save@1.5x.png"
+
+    def test_unknown_asset_uses_original(self, loader: AssetLoader) -> None:
+        """Test that assets missing from the manifest are not scaled."""
+        assert loader.path("other.png", 2.0).name == "other.png"
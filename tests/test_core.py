@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import gc
 import os
 import sys
 from unittest.mock import patch
@@ -20,8 +21,8 @@ except ImportError:
 pytestmark = pytest.mark.skipif(not TKINTER_AVAILABLE, reason="tkinter not available")
 
 if TKINTER_AVAILABLE:
-    from tkinter_unblur import __version__
-    from tkinter_unblur.core import _get_dpi_info, _scale_geometry
+    from tkinter_unblur import DpiInfo, __version__, _options, _styles
+    from tkinter_unblur.core import _get_dpi_info, _parse_geometry
 
 
 class TestVersion:
@@ -35,42 +36,389 @@ class TestVersion:
 
 
 class TestScaleGeometry:
-    """Tests for scale_geometry function."""
+    """Tests for DpiInfo.scale_geometry and unscale_geometry."""
 
     def test_scale_geometry_100_percent(self) -> None:
         """Test scaling at 100% (no change)."""
-        result = _scale_geometry("800x600+100+50", lambda v: int(float(v)))
-        assert result == "800x600+100+50"
+        assert DpiInfo(96, 96).scale_geometry("800x600+100+50") == "800x600+100+50"
 
     def test_scale_geometry_150_percent(self) -> None:
         """Test scaling at 150%."""
-        result = _scale_geometry("800x600+100+50", lambda v: int(float(v) * 1.5))
-        assert result == "1200x900+150+75"
+        assert DpiInfo(144, 144).scale_geometry("800x600+100+50") == "1200x900+150+75"
 
     def test_scale_geometry_200_percent(self) -> None:
         """Test scaling at 200%."""
-        result = _scale_geometry("800x600+100+50", lambda v: int(float(v) * 2.0))
+        result = DpiInfo(192, 192).scale_geometry("800x600+100+50")
         assert result == "1600x1200+200+100"
 
     def test_scale_geometry_125_percent(self) -> None:
         """Test scaling at 125%."""
-        result = _scale_geometry("800x600+100+50", lambda v: int(float(v) * 1.25))
-        assert result == "1000x750+125+62"
+        assert DpiInfo(120, 120).scale_geometry("800x600+100+50") == "1000x750+125+62"
 
     def test_scale_geometry_negative_position(self) -> None:
         """Test scaling with negative position values."""
-        result = _scale_geometry("800x600+-100+-50", lambda v: int(float(v) * 1.5))
+        result = DpiInfo(144, 144).scale_geometry("800x600+-100+-50")
         assert result == "1200x900+-150+-75"
 
     def test_scale_geometry_invalid_format(self) -> None:
         """Test that invalid geometry raises ValueError."""
         with pytest.raises(ValueError, match="Invalid geometry string format"):
-            _scale_geometry("invalid", lambda v: int(float(v)))
+            DpiInfo(96, 96).scale_geometry("invalid")
 
     def test_scale_geometry_partial_format(self) -> None:
-        """Test that partial geometry raises ValueError."""
+        """Test that a size without a position is scaled."""
+        assert DpiInfo(144, 144).scale_geometry("800x600") == "1200x900"
+
+    def test_unscale_geometry_edge_offsets(self) -> None:
+        """Test that offsets from the right and bottom edges are kept."""
+        info = DpiInfo(144, 144)
+        assert info.unscale_geometry("300x150-0-0") == "200x100-0-0"
+        assert info.unscale_geometry("300x150") == "200x100"
+        assert info.unscale_geometry("+150-75") == "+100-50"
+
+
+class TestParseGeometry:
+    """Tests for the memoized geometry parser used by auto-scale mode."""
+
+    def test_parse_full_geometry(self) -> None:
+        """Full geometry strings are split into all components."""
+        geometry = _parse_geometry("800x600+100-50")
+        assert (geometry.width, geometry.height) == (800, 600)
+        assert (geometry.x_sign, geometry.x) == ("+", 100)
+        assert (geometry.y_sign, geometry.y) == ("-", 50)
+
+    def test_parse_partial_geometry_round_trips(self) -> None:
+        """Size-only and position-only strings keep their form when scaled."""
+        assert _parse_geometry("800x600").format(lambda v: v * 2) == "1600x1200"
+        assert _parse_geometry("+10+-20").format(lambda v: v * 2) == "+20+-40"
+        assert _parse_geometry("=800x600").format(lambda v: v) == "800x600"
+
+    def test_parse_geometry_is_memoized(self) -> None:
+        """Parsing the same string twice returns the cached result."""
+        assert _parse_geometry("640x480+1+2") is _parse_geometry("640x480+1+2")
+
+    def test_update_keeps_missing_components(self) -> None:
+        """Updating with a partial geometry keeps the other components."""
+        base = _parse_geometry("800x600+100+50")
+        assert base.update(_parse_geometry("+5+5")).format(int) == "800x600+5+5"
+        assert base.update(_parse_geometry("10x20")).format(int) == "10x20+100+50"
+
+    @pytest.mark.parametrize("geometry", ["", "=", "invalid", "800x", "800x600+1"])
+    def test_parse_invalid_geometry(self, geometry: str) -> None:
+        """Test that invalid geometry raises ValueError."""
         with pytest.raises(ValueError, match="Invalid geometry string format"):
-            _scale_geometry("800x600", lambda v: int(float(v)))
+            _parse_geometry(geometry)
+
+
+class TestScaleStyles:
+    """Tests for building scaled ttk style settings."""
+
+    @pytest.fixture
+    def tkapp(self):
+        interp = tkinter.Tcl()
+        yield interp.tk
+        interp.tk.eval("proc destroy {args} {}")
+        interp.destroy()
+        gc.collect()
+
+    def test_scale_pixels_and_fonts(self, tkapp) -> None:
+        """Pixel lists and explicit font sizes are scaled."""
+        styles = {
+            ".": {"-borderwidth": "1", "-padding": "2 4"},
+            "Big.TButton": {"-font": "{Segoe UI} 9 bold"},
+        }
+        settings = _styles.scale_styles(tkapp, styles, lambda v: int(v * 1.5))
+        assert settings == (
+            ".",
+            ("-borderwidth", "1", "-padding", ("3", "6")),
+            "Big.TButton",
+            ("-font", ("Segoe UI", "13", "bold")),
+        )
+
+    def test_skip_named_fonts_and_units(self, tkapp) -> None:
+        """Named fonts and distances with units are left unchanged."""
+        styles = {"TEntry": {"-font": "TkDefaultFont", "-padding": "2m"}}
+        assert _styles.scale_styles(tkapp, styles, lambda v: v * 2) == ()
+
+    def test_merge_keeps_logical_values_of_scaled_options(self) -> None:
+        """Applied values keep their logical value; later changes are logical."""
+        logical = {"TButton": {"-padding": "10", "-borderwidth": "1"}}
+        applied = {"TButton": {"-padding": "15", "-borderwidth": "1"}}
+        current = {
+            "TButton": {"-padding": "15", "-borderwidth": "3"},
+            "Big.TButton": {"-padding": "20"},
+        }
+        assert _styles.merge_styles(current, logical, applied) == {
+            "TButton": {"-padding": "10", "-borderwidth": "3"},
+            "Big.TButton": {"-padding": "20"},
+        }
+
+
+class TestDpiInfo:
+    """Tests for the immutable, interned DpiInfo value type."""
+
+    def test_dpi_info_derived_values(self) -> None:
+        """Derived factors are precomputed from the DPI values."""
+        info = DpiInfo(144, 192)
+        assert info.scaling == 1.75
+        assert info.ratio == (7, 4)
+        assert info.inverse == 4 / 7
+        assert (info.factor_x, info.factor_y) == (1.5, 2.0)
+
+    def test_dpi_info_scaling(self) -> None:
+        """DpiInfo scales and unscales values, points and geometries."""
+        info = DpiInfo(144, 144)
+        assert info.scale_value(100) == 150
+        assert info.unscale_value(150) == 100
+        assert info.unscale_value("155") == 103
+        assert info.scale_point(10, 20) == (15, 30)
+        assert info.scale_geometry("800x600+100+50") == "1200x900+150+75"
+        assert info.unscale_geometry("1200x900+150+75") == "800x600+100+50"
+
+    def test_dpi_info_without_dpi(self) -> None:
+        """Without DPI values, the scaling is 1.0 on both axes."""
+        info = DpiInfo(None, None)
+        assert (info.scaling, info.ratio, info.inverse) == (1.0, (1, 1), 1.0)
+        assert (info.factor_x, info.factor_y) == (1.0, 1.0)
+
+    def test_dpi_info_is_interned(self) -> None:
+        """Equal DPI values share one instance, also across copies."""
+        import copy
+        import pickle
+
+        info = DpiInfo(120, 120)
+        assert DpiInfo(120, 120) is info
+        assert DpiInfo(120, 144) is not info
+        assert copy.copy(info) is info
+        assert pickle.loads(pickle.dumps(info)) is info
+
+    def test_dpi_info_unpacks_as_tuple(self) -> None:
+        """DpiInfo unpacks as (dpi_x, dpi_y, scaling)."""
+        dpi_x, dpi_y, scaling = DpiInfo(144, 144)
+        assert (dpi_x, dpi_y, scaling) == (144, 144, 1.5)
+
+    def test_dpi_info_is_immutable(self) -> None:
+        """DpiInfo cannot be modified and has no instance dict."""
+        info = DpiInfo(96, 96)
+        with pytest.raises(AttributeError):
+            info.scaling = 2.0  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            del info.dpi_x
+        assert not hasattr(info, "__dict__")
+
+    def test_scale_context_alias(self) -> None:
+        """ScaleContext is an alias for DpiInfo."""
+        from tkinter_unblur import ScaleContext
+
+        assert ScaleContext is DpiInfo
+
+
+class TestScaleDefaults:
+    """Tests for building scaled option database defaults."""
+
+    def test_scale_pixel_defaults(self) -> None:
+        """Pixel defaults are scaled; units and zero values are skipped."""
+        defaults = {
+            "*Button.borderWidth": "2",
+            "*Button.padX": "3m",
+            "*Frame.highlightThickness": "0",
+            "*Scrollbar.width": "11",
+        }
+        settings = _options.scale_defaults(defaults, lambda v: int(v * 1.5))
+        assert settings == ("*Button.borderWidth", "3", "*Scrollbar.width", "16")
+
+
+class _FakeWidget:
+    """A widget path backed by a Tcl proc that records configure calls."""
+
+    def __init__(self, root, path: str) -> None:
+        self._root = root
+        self._path = path
+        root.tk.eval(
+            f"proc {path} {{args}} {{lappend ::calls [list {path} {{*}}$args]}}"
+        )
+        root.tk.eval(f"set ::exists({path}) 1")
+
+    def __str__(self) -> str:
+        return self._path
+
+    def register(self, func) -> str:
+        return self._root.register(func)
+
+    def deletecommand(self, name: str) -> None:
+        self._root.deletecommand(name)
+
+
+class TestDeferredConfigure:
+    """Tests for the coalescing configure queue, using Tcl without Tk."""
+
+    @pytest.fixture
+    def root(self):
+        from tkinter_unblur import Tk
+
+        root = Tk(useTk=False)
+        root.tk.eval("set ::calls {}; proc winfo {cmd w} {info exists ::exists($w)}")
+        yield root
+        # Free the interpreter on this thread. If a reference cycle kept it
+        # alive, a later collection on another thread would make Tcl abort.
+        root.tk.eval("proc destroy {args} {}")
+        root.destroy()
+        gc.collect()
+
+    def _calls(self, root) -> list[tuple[str, ...]]:
+        return [
+            tuple(root.tk.splitlist(c))
+            for c in root.tk.splitlist(root.tk.eval("set ::calls"))
+        ]
+
+    def test_writes_are_merged_and_flushed_once(self, root) -> None:
+        """Only the last value per widget and option is applied, in one call."""
+        label = _FakeWidget(root, ".label")
+        button = _FakeWidget(root, ".button")
+        for i in range(100):
+            root.defer_configure(label, "text", f"item {i}")
+            root.defer_configure(label, "width", i)
+        root.defer_configure(button, "state", "disabled")
+
+        assert root.pending_configures == 3
+        assert root.merged_configures == 198
+        assert root.flush_configures() == 3
+        assert root.pending_configures == 0
+        assert self._calls(root) == [
+            (".label", "configure", "-text", "item 99", "-width", "99"),
+            (".button", "configure", "-state", "disabled"),
+        ]
+
+    def test_flushes_when_idle(self, root) -> None:
+        """Writes are applied by the event loop's next idle callback."""
+        label = _FakeWidget(root, ".label")
+        root.defer_configure(label, "text", "a")
+        root.defer_configure(label, "text", "b")
+
+        root.update_idletasks()
+
+        assert self._calls(root) == [(".label", "configure", "-text", "b")]
+        assert root.flush_configures() == 0
+
+    def test_callables_and_trailing_underscore(self, root) -> None:
+        """Callables are registered, and option_ names are accepted."""
+        button = _FakeWidget(root, ".button")
+        clicked = []
+        root.defer_configure(button, "command", lambda: clicked.append(True))
+        root.defer_configure(button, "class_", "Toolbutton")
+        root.flush_configures()
+
+        (call,) = self._calls(root)
+        assert call[2] == "-command"
+        assert call[4:] == ("-class", "Toolbutton")
+        root.tk.call(call[3])
+        assert clicked == [True]
+
+    def test_replaced_commands_are_deleted(self, root) -> None:
+        """Only the command of the last write to an option stays registered."""
+        button = _FakeWidget(root, ".button")
+        commands = len(root.tk.splitlist(root.tk.call("info", "commands")))
+        for i in range(100):
+            root.defer_configure(button, "command", lambda i=i: i)
+        root.flush_configures()
+
+        assert len(root.tk.splitlist(root.tk.call("info", "commands"))) == commands + 1
+
+    def test_none_values_are_ignored(self, root) -> None:
+        """None values are skipped, as configure() does."""
+        label = _FakeWidget(root, ".label")
+        root.defer_configure(label, "image", None)
+        assert root.pending_configures == 0
+        root.defer_configure(label, "text", "a")
+        root.defer_configure(label, "text", None)
+        root.flush_configures()
+
+        assert self._calls(root) == [(".label", "configure", "-text", "a")]
+
+    def test_errors_do_not_drop_other_writes(self, root) -> None:
+        """Failed writes raise after the remaining writes are applied."""
+        label = _FakeWidget(root, ".label")
+        broken = _FakeWidget(root, ".broken")
+        root.tk.eval("proc .broken {args} {error {unknown option}}")
+        root.defer_configure(_FakeWidget(root, ".gone"), "text", "x")
+        root.tk.eval("unset ::exists(.gone)")
+        root.defer_configure(broken, "bogus", 1)
+        root.defer_configure(label, "text", "ok")
+
+        with pytest.raises(tkinter.TclError, match=r"\.broken: unknown option"):
+            root.flush_configures()
+        assert self._calls(root) == [(".label", "configure", "-text", "ok")]
+
+
+class TestAutoScaleDpiChange:
+    """Tests for auto-scaled window sizes on DPI change, using Tcl without Tk."""
+
+    @pytest.fixture
+    def root(self):
+        from tkinter_unblur import Tk
+
+        with patch(
+            "tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(96, 96)
+        ) as get_dpi_info:
+            root = Tk(useTk=False, auto_scale=True)
+            root.tk.eval(
+                """
+                proc winfo {args} {return 0x0}
+                proc event {args} {}
+                array set ::wm {geometry 1x1+0+0 minsize {1 1} maxsize {0 0}}
+                proc wm {command window args} {
+                    if {![llength $args]} {return $::wm($command)}
+                    lappend ::wm_calls [list $command {*}$args]
+                    set ::wm($command) [join $args]
+                }
+                """
+            )
+            root.get_dpi_info = get_dpi_info
+            yield root
+            root.tk.eval("proc destroy {args} {}")
+            root.destroy()
+        gc.collect()
+
+    def test_user_resize_and_move_survive_dpi_change(self, root) -> None:
+        """The current size is rescaled from the previous DPI; the position kept."""
+        root.geometry("400x300+10+20")
+        root.minsize(200, 100)
+        # The user drags the window to another monitor and resizes it
+        root.tk.eval("set ::wm(geometry) 500x350+1900+100; set ::wm_calls {}")
+
+        root.get_dpi_info.return_value = DpiInfo(144, 144)
+        assert root.update_dpi() is True
+
+        calls = [
+            tuple(root.tk.splitlist(call))
+            for call in root.tk.splitlist(root.tk.eval("set ::wm_calls"))
+        ]
+        assert calls == [("minsize", "300", "150"), ("geometry", "750x525")]
+        assert root.geometry() == "500x350"
+
+    def test_natural_size_is_not_fixed(self, root) -> None:
+        """Windows without a logical size keep their natural size."""
+        root.geometry("+10+20")
+        assert root.dpi_info is DpiInfo(96, 96)
+        root.tk.eval("set ::wm_calls {}")
+
+        root.get_dpi_info.return_value = DpiInfo(192, 192)
+        assert root.update_dpi() is True
+
+        assert root.tk.eval("set ::wm_calls") == ""
+
+    def test_wait_for_dpi_change_without_reading_dpi(self, root) -> None:
+        """A waiter wakes on a Configure check, though nothing read the DPI."""
+        import asyncio
+
+        async def main() -> DpiInfo:
+            waiter = asyncio.ensure_future(root.wait_for_dpi_change())
+            await asyncio.sleep(0)
+            root.get_dpi_info.return_value = DpiInfo(144, 144)
+            root._check_dpi()
+            return await asyncio.wait_for(waiter, timeout=5)
+
+        assert asyncio.run(main()) is DpiInfo(144, 144)
 
 
 class TestGetDpiInfo:
@@ -205,6 +553,234 @@ class TestTkClass:
         finally:
             root.destroy()
 
+    @pytest.mark.skipif(
+        os.environ.get("DISPLAY") is None and os.name != "nt",
+        reason="No display available",
+    )
+    def test_tk_auto_scale_geometry(self) -> None:
+        """Auto-scale mode scales geometry and re-applies it on DPI change."""
+        from tkinter_unblur import Tk
+
+        with patch(
+            "tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(96, 96)
+        ) as get_dpi_info:
+            root = Tk(auto_scale=True)
+            try:
+                root.geometry("200x100+10+20")
+                root.minsize(50, 40)
+                assert root.minsize() == (50, 40)
+
+                get_dpi_info.return_value = DpiInfo(192, 192)
+                assert root.update_dpi() is True
+                assert root.wm_minsize() == (50, 40)
+                scaled = root.tk.splitlist(root.tk.call("wm", "minsize", root))
+                assert tuple(map(int, scaled)) == (100, 80)
+                assert root.update_dpi() is False
+            finally:
+                root.destroy()
+
+    @pytest.mark.skipif(
+        os.environ.get("DISPLAY") is None and os.name != "nt",
+        reason="No display available",
+    )
+    def test_tk_scale_styles(self) -> None:
+        """scale_styles scales from logical values and caches per DPI."""
+        from tkinter import ttk
+
+        from tkinter_unblur import Tk
+
+        with patch(
+            "tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(144, 144)
+        ) as get_dpi_info:
+            root = Tk()
+            try:
+                style = ttk.Style(root)
+                style.configure("Scaled.TButton", padding=10, borderwidth=2)
+                root.scale_styles()
+                root.scale_styles()
+                assert str(style.configure("Scaled.TButton", "padding")) == "15"
+
+                get_dpi_info.return_value = DpiInfo(192, 192)
+                root.update_dpi()
+                assert str(style.configure("Scaled.TButton", "padding")) == "20"
+                assert str(style.configure("Scaled.TButton", "borderwidth")) == "4"
+                assert len(root._scaled_styles) == 2
+            finally:
+                root.destroy()
+
+    @pytest.mark.skipif(
+        os.environ.get("DISPLAY") is None and os.name != "nt",
+        reason="No display available",
+    )
+    def test_tk_scale_styles_after_configure(self) -> None:
+        """Styles configured after the first scale are scaled by the next call."""
+        from tkinter import ttk
+
+        from tkinter_unblur import Tk
+
+        with patch(
+            "tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(144, 144)
+        ) as get_dpi_info:
+            root = Tk()
+            try:
+                style = ttk.Style(root)
+                style.configure("First.TButton", padding=10)
+                root.scale_styles()
+                style.configure("Second.TButton", padding=4)
+                style.configure("First.TButton", borderwidth=2)
+                root.scale_styles()
+                assert str(style.configure("First.TButton", "padding")) == "15"
+                assert str(style.configure("First.TButton", "borderwidth")) == "3"
+                assert str(style.configure("Second.TButton", "padding")) == "6"
+
+                get_dpi_info.return_value = DpiInfo(192, 192)
+                root.update_dpi()
+                assert str(style.configure("First.TButton", "padding")) == "20"
+                assert str(style.configure("Second.TButton", "padding")) == "8"
+            finally:
+                root.destroy()
+
+    @pytest.mark.skipif(
+        os.environ.get("DISPLAY") is None and os.name != "nt",
+        reason="No display available",
+    )
+    def test_tk_wait_for_dpi_change(self) -> None:
+        """wait_for_dpi_change resolves when update_dpi detects a change."""
+        import asyncio
+
+        from tkinter_unblur import Tk
+
+        with patch(
+            "tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(96, 96)
+        ) as get_dpi_info:
+            root = Tk()
+            try:
+                events: list[str] = []
+                root.bind("<<DpiChanged>>", lambda e: events.append("changed"))
+
+                async def change_dpi() -> None:
+                    await asyncio.sleep(0)
+                    get_dpi_info.return_value = DpiInfo(144, 144)
+                    root.update_dpi()
+
+                async def main():
+                    waiter = asyncio.ensure_future(root.wait_for_dpi_change())
+                    await change_dpi()
+                    return await asyncio.wait_for(waiter, timeout=5)
+
+                info = asyncio.run(main())
+                assert info is DpiInfo(144, 144)
+                assert events == ["changed"]
+                assert root._dpi_waiters == []
+            finally:
+                root.destroy()
+
+    @pytest.mark.skipif(
+        os.environ.get("DISPLAY") is None and os.name != "nt",
+        reason="No display available",
+    )
+    def test_tk_configure_checks_dpi(self) -> None:
+        """Moving or resizing the window runs update_dpi() once DPI is used."""
+        from tkinter_unblur import Tk
+
+        with patch(
+            "tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(96, 96)
+        ) as get_dpi_info:
+            root = Tk()
+            try:
+                events: list[str] = []
+                # Replacing the window's own bindings keeps the check
+                root.bind("<Configure>", lambda e: events.append("configure"))
+                root.bind("<<DpiChanged>>", lambda e: events.append("changed"))
+                root.event_generate("<Configure>")
+                assert get_dpi_info.call_count == 0  # Still lazy
+
+                assert root.dpi_info is DpiInfo(96, 96)
+                get_dpi_info.return_value = DpiInfo(144, 144)
+                root.event_generate("<Configure>")
+                assert root.dpi_info is DpiInfo(144, 144)
+                assert events == ["configure", "changed", "configure"]
+            finally:
+                root.destroy()
+
+    @pytest.mark.skipif(
+        os.environ.get("DISPLAY") is None and os.name != "nt",
+        reason="No display available",
+    )
+    def test_tk_dpi_detected_lazily(self) -> None:
+        """DPI detection runs on first use, and only once."""
+        from tkinter_unblur import Tk
+
+        with patch(
+            "tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(144, 144)
+        ) as get_dpi_info:
+            root = Tk()
+            try:
+                get_dpi_info.assert_not_called()
+                assert (root.dpi_x, root.dpi_y, root.dpi_scaling) == (144, 144, 1.5)
+                get_dpi_info.assert_called_once()
+            finally:
+                root.destroy()
+
+    @pytest.mark.skipif(
+        os.environ.get("DISPLAY") is None and os.name != "nt",
+        reason="No display available",
+    )
+    def test_tk_deferred_show(self) -> None:
+        """A deferred window stays withdrawn until show() applies its sizes."""
+        from tkinter_unblur import Tk
+
+        with patch(
+            "tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(192, 192)
+        ) as get_dpi_info:
+            root = Tk(auto_scale=True, deferred_show=True)
+            try:
+                root.geometry("200x100")
+                root.minsize(50, 40)
+                assert root.state() == "withdrawn"
+                get_dpi_info.assert_not_called()
+
+                root.update()
+                assert root.state() == "normal"
+                scaled = root.tk.splitlist(root.tk.call("wm", "minsize", root))
+                assert tuple(map(int, scaled)) == (100, 80)
+
+                root.withdraw()
+                root.show()
+                assert root.state() == "withdrawn"
+            finally:
+                root.destroy()
+
+    @pytest.mark.skipif(
+        os.environ.get("DISPLAY") is None and os.name != "nt",
+        reason="No display available",
+    )
+    def test_tk_install_scaled_defaults(self) -> None:
+        """New widgets pick up scaled defaults, rewritten on DPI change."""
+        from tkinter_unblur import Tk
+
+        with patch(
+            "tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(192, 192)
+        ) as get_dpi_info:
+            root = Tk()
+            try:
+                default = int(tkinter.Scrollbar(root).cget("width"))
+                root.install_scaled_defaults(font=("Helvetica", 9))
+                scrollbar = tkinter.Scrollbar(root)
+                assert int(scrollbar.cget("width")) == default * 2
+                label = tkinter.Label(root)
+                assert root.tk.splitlist(label.cget("font"))[1] == "18"
+
+                root.option_add("*Scrollbar.width", 5)
+                assert int(tkinter.Scrollbar(root).cget("width")) == 5
+
+                get_dpi_info.return_value = DpiInfo(144, 144)
+                root.update_dpi()
+                label = tkinter.Label(root)
+                assert root.tk.splitlist(label.cget("font"))[1] == "13"
+            finally:
+                root.destroy()
+
 
 class TestHdpiTkAlias:
     """Tests for the HdpiTk backwards compatibility alias."""
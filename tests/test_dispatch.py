@@ -0,0 +1,102 @@
+"""Tests for tkinter_unblur.dispatch module."""
+
+from __future__ import annotations
+
+import gc
+import threading
+
+import pytest
+
+# Check if tkinter is available
+try:
+    import tkinter
+
+    TKINTER_AVAILABLE = True
+except ImportError:
+    TKINTER_AVAILABLE = False
+
+# Skip entire module if tkinter is not available
+pytestmark = pytest.mark.skipif(not TKINTER_AVAILABLE, reason="tkinter not available")
+
+if TKINTER_AVAILABLE:
+    from tkinter_unblur import UpdateDispatcher
+
+
+@pytest.fixture
+def interp():
+    """A Tcl interpreter without Tk, which needs no display."""
+    interp = tkinter.Tcl()
+    yield interp
+    # Free the interpreter on this thread. If a reference cycle kept it
+    # alive, a later collection on another thread would make Tcl abort.
+    interp.tk.eval("proc destroy {args} {}")
+    interp.destroy()
+    gc.collect()
+
+
+class TestUpdateDispatcher:
+    """Tests for the UpdateDispatcher class."""
+
+    def test_submit_from_threads_and_flush(self, interp) -> None:
+        """Updates from many threads are all applied by a single flush."""
+        dispatcher = UpdateDispatcher(interp)
+        results: list[int] = []
+
+        def worker(n: int) -> None:
+            for i in range(100):
+                dispatcher.submit(results.append, n * 100 + i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert dispatcher.pending == 400
+        assert dispatcher.flush() == 400
+        assert sorted(results) == list(range(400))
+        assert dispatcher.pending == 0
+
+    def test_flush_reports_exceptions_and_continues(self, interp) -> None:
+        """A failing update is reported and does not drop later updates."""
+        reported: list[type[BaseException]] = []
+        interp.report_callback_exception = lambda exc, val, tb: reported.append(exc)
+        dispatcher = UpdateDispatcher(interp)
+        results: list[str] = []
+
+        dispatcher.submit(int, "not a number")
+        dispatcher.submit(results.append, "after")
+
+        assert dispatcher.flush() == 2
+        assert reported == [ValueError]
+        assert results == ["after"]
+
+    def test_updates_submitted_during_flush_wait(self, interp) -> None:
+        """Updates queued while flushing run in the next flush."""
+        dispatcher = UpdateDispatcher(interp)
+        results: list[str] = []
+        dispatcher.submit(dispatcher.submit, results.append, "later")
+
+        assert dispatcher.flush() == 1
+        assert results == []
+        assert dispatcher.flush() == 1
+        assert results == ["later"]
+
+    def test_start_flushes_once_per_frame(self, interp) -> None:
+        """A running dispatcher flushes from a single after() callback."""
+        dispatcher = UpdateDispatcher(interp, interval=1)
+        results: list[int] = []
+        dispatcher.start()
+        dispatcher.start()
+        try:
+            assert dispatcher.running
+            for i in range(10):
+                dispatcher.submit(results.append, i)
+            while len(results) < 10:
+                interp.tk.dooneevent(0)
+            assert results == list(range(10))
+            assert len(interp.tk.call("after", "info")) == 1
+        finally:
+            dispatcher.stop()
+        assert not dispatcher.running
+        assert interp.tk.call("after", "info") == ""
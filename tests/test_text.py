@@ -0,0 +1,91 @@
+"""Tests for tkinter_unblur.text module."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+# Check if tkinter is available
+try:
+    import tkinter  # noqa: F401
+
+    TKINTER_AVAILABLE = True
+except ImportError:
+    TKINTER_AVAILABLE = False
+
+# Skip entire module if tkinter is not available or there is no display
+pytestmark = [
+    pytest.mark.skipif(not TKINTER_AVAILABLE, reason="tkinter not available"),
+    pytest.mark.skipif(
+        os.environ.get("DISPLAY") is None and os.name != "nt",
+        reason="No display available",
+    ),
+]
+
+if TKINTER_AVAILABLE:
+    from tkinter_unblur import DpiInfo, ScaledText, Tk
+
+
+@pytest.fixture
+def root():
+    """A Tk window at a simulated 150% scaling."""
+    with patch(
+        "tkinter_unblur.core._get_dpi_info", return_value=DpiInfo(144, 144)
+    ) as get_dpi_info:
+        root = Tk()
+        root.get_dpi_info = get_dpi_info
+        yield root
+        root.destroy()
+
+
+class TestScaledText:
+    """Tests for the ScaledText widget."""
+
+    def test_options_are_scaled(self, root) -> None:
+        """Widget and tag pixel options and fonts are scaled on configure."""
+        text = ScaledText(root, spacing1=2, tabs=(40, "center", 80), padx="1c")
+        text.tag_configure("error", font=("Helvetica", 10, "bold"), lmargin1=16)
+
+        assert int(text.cget("spacing1")) == 3
+        assert root.tk.splitlist(text.cget("tabs")) == ("60", "center", "120")
+        assert str(text.cget("padx")) == "1c"
+        assert str(text.tag_cget("error", "lmargin1")) == "24"
+        font = root.tk.splitlist(text.tag_cget("error", "font"))
+        assert font == ("Helvetica", "15", "bold")
+
+    def test_rescale_on_dpi_change(self, root) -> None:
+        """All tags are rescaled from logical values when the DPI changes."""
+        text = ScaledText(root, spacing3=4)
+        for i in range(10):
+            text.tag_configure(f"tag{i}", spacing1=i, rmargin=10)
+        text.tag_delete("tag9")
+
+        root.get_dpi_info.return_value = DpiInfo(192, 192)
+        assert root.update_dpi()
+
+        assert int(text.cget("spacing3")) == 8
+        assert str(text.tag_cget("tag5", "spacing1")) == "10"
+        assert str(text.tag_cget("tag5", "rmargin")) == "20"
+        assert "tag9" not in text._logical_tags
+
+    def test_rescale_survives_replaced_bindings(self, root) -> None:
+        """Binding <<DpiChanged>> without add does not stop rescaling."""
+        text = ScaledText(root, spacing3=4)
+        events: list[str] = []
+        root.bind("<<DpiChanged>>", lambda e: events.append("app"))
+
+        root.get_dpi_info.return_value = DpiInfo(192, 192)
+        root.update_dpi()
+        assert int(text.cget("spacing3")) == 8
+        assert events == ["app"]
+
+    def test_destroy_stops_rescaling(self, root) -> None:
+        """Destroyed widgets are no longer rescaled."""
+        text = ScaledText(root)
+        text.destroy()
+
+        assert text not in root._scaled_texts
+        root.get_dpi_info.return_value = DpiInfo(192, 192)
+        assert root.update_dpi()
@@ -1,158 +1,312 @@
-"""Visual test script to verify DPI awareness works correctly.
+"""Visual regression tests for DPI scaling under virtual X displays.
 
-Run this on a Windows machine with high-DPI display to verify text is sharp.
+Reference layouts are rendered at several simulated DPIs, each case in its
+own process so every Tk interpreter starts clean. The cases are fanned out
+across a process pool, and every worker gets a private Xvfb display, so
+windows never overlap. Window contents are captured and the measured
+geometry and pixel sizes are compared against the expected scaled values.
+The layout time of each case is reported and checked against a budget.
 
-This test shows THREE windows:
-1. Standard tkinter.Tk (DPI-unaware) - LARGE and BLURRY
-2. tkinter-unblur with scaling - LARGE and SHARP (recommended approach)
-3. tkinter-unblur without scaling - SMALL and SHARP (shows what happens without scale_geometry)
+Requires Linux, Pillow and either Xvfb or an X display (run serially).
 """
 
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
 import subprocess
 import sys
-from pathlib import Path
-
-
-def main() -> None:
-    """Create three test windows in separate processes."""
-    print("=" * 70)
-    print("TKINTER DPI AWARENESS VISUAL TEST")
-    print("=" * 70)
-    print()
-    print("Launching THREE windows for comparison:")
-    print("1. LEFT:   Standard Tk (DPI-unaware) - Large but blurry")
-    print("2. MIDDLE: Unblur Tk with scaling - Large and sharp ✓")
-    print("3. RIGHT:  Unblur Tk no scaling - Small but sharp")
-    print()
-
-    test_dir = Path(__file__).parent
-
-    # Temporary script files
-    standard_script = test_dir / "_temp_standard.py"
-    scaled_script = test_dir / "_temp_scaled.py"
-    unscaled_script = test_dir / "_temp_unscaled.py"
-
-    # Window 1: Standard Tk (DPI-unaware)
-    standard_code = """
+import time
 import tkinter
-from tkinter import ttk
-
-root = tkinter.Tk()
-root.title("1. Standard Tk (Blurry)")
-root.geometry("450x400+50+100")
-
-frame = ttk.Frame(root, padding=20)
-frame.pack(fill="both", expand=True)
-
-ttk.Label(frame, text="Standard tkinter.Tk", font=("Segoe UI", 28, "bold")).pack(pady=8)
-ttk.Label(frame, text="BLURRY", font=("Segoe UI", 16), foreground="red").pack(pady=8)
-ttk.Label(frame, text="Windows scaled this window", font=("Segoe UI", 12)).pack(pady=5)
-ttk.Label(frame, text="abcdefghijklmnopqrstuvwxyz\\nABCDEFGHIJKLMNOPQRSTUVWXYZ\\n0123456789",
-          font=("Segoe UI", 14), justify="center").pack(pady=8)
-ttk.Button(frame, text="Test Button", width=18).pack(pady=5)
-
-root.mainloop()
-"""
-
-    # Window 2: DPI-aware Tk WITH scaling (recommended)
-    scaled_code = """
-from tkinter import ttk
-from tkinter_unblur import Tk
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, NamedTuple
+from unittest.mock import patch
+
+import pytest
 
-root = Tk()
-root.title("2. Unblur Tk + Scaling (Sharp) ✓")
-root.geometry(root.scale_geometry("450x400+550+100"))
+pytestmark = [
+    pytest.mark.skipif(sys.platform != "linux", reason="Requires X11 on Linux"),
+    pytest.mark.skipif(
+        shutil.which("Xvfb") is None and os.environ.get("DISPLAY") is None,
+        reason="Neither Xvfb nor a display is available",
+    ),
+]
 
-frame = ttk.Frame(root, padding=20)
-frame.pack(fill="both", expand=True)
+ImageChops = pytest.importorskip("PIL.ImageChops")
+ImageGrab = pytest.importorskip("PIL.ImageGrab")
 
-# Scale font sizes to match physical size of standard Tk
-ttk.Label(frame, text="tkinter-unblur Tk", font=("Segoe UI", root.scale_value(28), "bold")).pack(pady=8)
-ttk.Label(frame, text="SHARP", font=("Segoe UI", root.scale_value(16)), foreground="green").pack(pady=8)
-ttk.Label(frame, text="Using scale_geometry()", font=("Segoe UI", root.scale_value(12))).pack(pady=5)
-ttk.Label(frame, text="abcdefghijklmnopqrstuvwxyz\\nABCDEFGHIJKLMNOPQRSTUVWXYZ\\n0123456789",
-          font=("Segoe UI", root.scale_value(14)), justify="center").pack(pady=8)
+from tkinter_unblur import DpiInfo, ScaledText, Tk
+
+# Simulated DPIs: 100%, 125%, 150% and 200%
+DPIS = (96, 120, 144, 192)
+
+# Logical window size of every reference layout
+LOGICAL_SIZE = (240, 160)
 
-info = f"DPI: {root.dpi_x}x{root.dpi_y}  ({root.dpi_scaling:.0%})"
-ttk.Label(frame, text=info, font=("Consolas", root.scale_value(10))).pack(pady=2)
+# Maximum time from creating the window to the first scaled frame
+MAX_LAYOUT_SECONDS = 2.0
 
-button = ttk.Button(frame, text="Test Button", width=18)
-button.configure(style="Scaled.TButton")
-# Create a custom style with scaled font
-style = ttk.Style()
-style.configure("Scaled.TButton", font=("Segoe UI", root.scale_value(9)))
-button.pack(pady=5)
+MAX_WORKERS = 8
 
-root.mainloop()
-"""
-
-    # Window 3: DPI-aware Tk WITHOUT scaling
-    unscaled_code = """
-from tkinter import ttk
-from tkinter_unblur import Tk
 
-root = Tk()
-root.title("3. Unblur Tk No Scaling (Sharp)")
-root.geometry("450x400+1050+100")
+class CaseResult(NamedTuple):
+    """The checks and layout time of a rendered case.
+
+    Each check maps a name to the measured value, the expected value and
+    the tolerance in pixels.
+    """
 
-frame = ttk.Frame(root, padding=20)
-frame.pack(fill="both", expand=True)
+    checks: dict[str, tuple[Any, tuple[int, ...], int]]
+    seconds: float
 
-ttk.Label(frame, text="tkinter-unblur Tk", font=("Segoe UI", 28, "bold")).pack(pady=8)
-ttk.Label(frame, text="SHARP", font=("Segoe UI", 16), foreground="blue").pack(pady=8)
-ttk.Label(frame, text="No scale_geometry()", font=("Segoe UI", 12)).pack(pady=5)
-ttk.Label(frame, text="abcdefghijklmnopqrstuvwxyz\\nABCDEFGHIJKLMNOPQRSTUVWXYZ\\n0123456789",
-          font=("Segoe UI", 14), justify="center").pack(pady=8)
 
-info = f"DPI: {root.dpi_x}x{root.dpi_y}  ({root.dpi_scaling:.0%})"
-ttk.Label(frame, text=info, font=("Consolas", 10)).pack(pady=2)
-ttk.Button(frame, text="Test Button", width=18).pack(pady=5)
-
-root.mainloop()
-"""
+# A layout builds its widgets and returns a function measuring a capture
+Measure = Callable[[Any], dict[str, tuple[Any, tuple[int, ...], int]]]
 
-    # Write temporary scripts
-    standard_script.write_text(standard_code, encoding="utf-8")
-    scaled_script.write_text(scaled_code, encoding="utf-8")
-    unscaled_script.write_text(unscaled_code, encoding="utf-8")
 
+def _red_box(image: Any) -> tuple[int, int, int, int] | None:
+    """Return the bounding box of the pure red pixels in an RGB image."""
+    red, green, blue = image.split()
+    high = red.point(lambda value: 255 if value > 200 else 0)
+    low = ImageChops.lighter(green, blue).point(lambda value: 255 if value < 56 else 0)
+    box: tuple[int, int, int, int] | None = ImageChops.multiply(high, low).getbbox()
+    return box
+
+
+def _left(bbox: tuple[int, int, int, int] | None) -> tuple[int] | None:
+    """Return the left edge of a text bounding box, if it is visible."""
+    return None if bbox is None else (bbox[0],)
+
+
+def _layout_window(root: Tk) -> Measure:
+    """An empty auto-scaled window with a minimum size."""
+    root.minsize(200, 120)
+    return lambda image: {}
+
+
+def _layout_canvas(root: Tk) -> Measure:
+    """A red rectangle drawn at scaled canvas coordinates."""
+    canvas = tkinter.Canvas(
+        root, background="white", borderwidth=0, highlightthickness=0
+    )
+    canvas.pack(fill="both", expand=True)
+    box = (*root.dpi_info.scale_point(20, 20), *root.dpi_info.scale_point(120, 70))
+    canvas.create_rectangle(*box, fill="red", outline="")
+    return lambda image: {"rectangle": (_red_box(image), box, 1)}
+
+
+def _layout_frames(root: Tk) -> Measure:
+    """A red frame of scaled size inside a frame with scaled padding."""
+    scale = root.scale_value
+    outer = tkinter.Frame(
+        root,
+        background="white",
+        borderwidth=0,
+        highlightthickness=0,
+        padx=scale(12),
+        pady=scale(8),
+    )
+    outer.pack(anchor="nw")
+    tkinter.Frame(outer, background="red", width=scale(80), height=scale(40)).pack()
+
+    def measure(image: Any) -> dict[str, tuple[Any, tuple[int, ...], int]]:
+        left, top = scale(12), scale(8)
+        return {
+            "inner": (
+                _red_box(image),
+                (left, top, left + scale(80), top + scale(40)),
+                1,
+            ),
+            "outer": (
+                (outer.winfo_width(), outer.winfo_height()),
+                (scale(80) + 2 * left, scale(40) + 2 * top),
+                0,
+            ),
+        }
+
+    return measure
+
+
+def _layout_text(root: Tk) -> Measure:
+    """A ScaledText with logical padding and a tag with a logical margin."""
+    text = ScaledText(root, padx=10, borderwidth=0, highlightthickness=0)
+    text.tag_configure("indent", lmargin1=24)
+    text.insert("1.0", "plain\n", (), "indented\n", "indent")
+    text.pack(fill="both", expand=True)
+
+    def measure(image: Any) -> dict[str, tuple[Any, tuple[int, ...], int]]:
+        scale = root.scale_value
+        return {
+            "padx": (_left(text.bbox("1.0")), (scale(10),), 0),
+            "lmargin1": (_left(text.bbox("2.0")), (scale(10) + scale(24),), 0),
+        }
+
+    return measure
+
+
+LAYOUTS: dict[str, Callable[[Tk], Measure]] = {
+    "window": _layout_window,
+    "canvas": _layout_canvas,
+    "frames": _layout_frames,
+    "text": _layout_text,
+}
+
+# "rescale" renders the text layout at 100% and then changes the DPI
+CASES = [(layout, dpi) for layout in (*LAYOUTS, "rescale") for dpi in DPIS]
+
+
+def _simulate_dpi(root: Tk, dpi: int) -> None:
+    """Scale fonts for a DPI, as Windows does for DPI-aware processes."""
+    root.tk.call("tk", "scaling", dpi / 72)
+
+
+def _render_case(layout: str, dpi: int) -> CaseResult:
+    """Render a case, capture the window and measure it. Runs in a worker."""
+    rescale = layout == "rescale"
+    initial_dpi = 96 if rescale else dpi
+    with patch("tkinter_unblur.core._get_dpi_info") as get_dpi_info:
+        get_dpi_info.return_value = DpiInfo(initial_dpi, initial_dpi)
+        start = time.perf_counter()
+        root = Tk(auto_scale=True, deferred_show=True)
+        try:
+            _simulate_dpi(root, initial_dpi)
+            root.geometry("{}x{}+0+0".format(*LOGICAL_SIZE))
+            measure = LAYOUTS["text" if rescale else layout](root)
+            root.show()
+            root.wait_visibility()
+            if rescale:
+                get_dpi_info.return_value = DpiInfo(dpi, dpi)
+                _simulate_dpi(root, dpi)
+                root.update_dpi()
+            root.update()
+            seconds = time.perf_counter() - start
+
+            x, y = root.winfo_rootx(), root.winfo_rooty()
+            width, height = root.winfo_width(), root.winfo_height()
+            image = ImageGrab.grab(
+                bbox=(x, y, x + width, y + height), xdisplay=os.environ["DISPLAY"]
+            ).convert("RGB")
+            size = root.dpi_info.scale_point(*LOGICAL_SIZE)
+            checks = {
+                "window": ((width, height), size, 0),
+                "capture": (image.size, size, 0),
+                **measure(image),
+            }
+        finally:
+            root.destroy()
+    return CaseResult(checks, seconds)
+
+
+def _start_xvfb() -> tuple[subprocess.Popen[bytes], str]:
+    """Start an Xvfb server on a free display number."""
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen(
+        [
+            "Xvfb",
+            "-displayfd",
+            str(write_fd),
+            "-screen",
+            "0",
+            "1024x768x24",
+            "-nolisten",
+            "tcp",
+        ],
+        pass_fds=(write_fd,),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        number = pipe.readline().strip()
+    if not number:
+        process.kill()
+        raise RuntimeError("Xvfb failed to start")
+    return process, f":{number}"
+
+
+def _use_display(displays: Any) -> None:
+    """Claim a display for a worker process."""
+    os.environ["DISPLAY"] = displays.get()
+
+
+def _matches(measured: Any, expected: tuple[int, ...], tolerance: int) -> bool:
+    """Whether measured values are within a tolerance of the expected ones."""
+    return (
+        measured is not None
+        and len(measured) == len(expected)
+        and all(
+            value is not None and abs(value - target) <= tolerance
+            for value, target in zip(measured, expected)
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def renders(
+    request: pytest.FixtureRequest,
+) -> Iterator[dict[tuple[str, int], Future[CaseResult]]]:
+    """Render all cases in parallel, each worker on its own Xvfb display."""
+    context = multiprocessing.get_context("spawn")
+    displays = context.Queue()
+    servers: list[subprocess.Popen[bytes]] = []
     try:
-        # Launch all three processes
-        proc1 = subprocess.Popen([sys.executable, str(standard_script)])
-        proc2 = subprocess.Popen([sys.executable, str(scaled_script)])
-        proc3 = subprocess.Popen([sys.executable, str(unscaled_script)])
-
-        print("✓ All windows launched")
-        print()
-        print("COMPARISON:")
-        print("-" * 70)
-        print("Window 1 (LEFT):   Large, blurry text (avoid this!)")
-        print("Window 2 (MIDDLE): Large, sharp text (recommended! ✓)")
-        print("Window 3 (RIGHT):  Small, sharp text (need to scale manually)")
-        print()
-        print("RECOMMENDATION:")
-        print("Use tkinter_unblur.Tk with scale_geometry() like Window 2")
-        print()
-        print("Example code:")
-        print("  from tkinter_unblur import Tk")
-        print("  root = Tk()")
-        print('  root.geometry(root.scale_geometry("800x600+100+100"))')
-        print()
-        print("Close all windows to exit...")
-        print("=" * 70)
-
-        # Wait for all processes
-        proc1.wait()
-        proc2.wait()
-        proc3.wait()
-
+        if shutil.which("Xvfb"):
+            workers = min(len(CASES), os.cpu_count() or 1, MAX_WORKERS)
+            for _ in range(workers):
+                server, display = _start_xvfb()
+                servers.append(server)
+                displays.put(display)
+        else:
+            # Windows would overlap on a shared display
+            workers = 1
+            displays.put(os.environ["DISPLAY"])
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_use_display,
+            initargs=(displays,),
+        ) as executor:
+            futures = {case: executor.submit(_render_case, *case) for case in CASES}
+            yield futures
+
+        plugins = request.config.pluginmanager
+        reporter = plugins.get_plugin("terminalreporter")
+        capture = plugins.get_plugin("capturemanager")
+        if reporter is not None and capture is not None:
+            with capture.global_and_fixture_disabled():
+                reporter.write_sep("-", f"visual case layout times ({workers} workers)")
+                for (layout, dpi), future in futures.items():
+                    if future.done() and future.exception() is None:
+                        seconds = future.result().seconds
+                        reporter.write_line(
+                            f"{layout:>8} @ {dpi} dpi: {seconds * 1000:7.1f} ms"
+                        )
     finally:
-        # Clean up
-        standard_script.unlink(missing_ok=True)
-        scaled_script.unlink(missing_ok=True)
-        unscaled_script.unlink(missing_ok=True)
-        print("\nTest complete.")
-
-
-if __name__ == "__main__":
-    main()
+        for server in servers:
+            server.terminate()
+            server.wait()
+
+
+@pytest.mark.parametrize(
+    ("layout", "dpi"), CASES, ids=[f"{layout}-{dpi}dpi" for layout, dpi in CASES]
+)
+def test_visual_case(
+    renders: dict[tuple[str, int], Future[CaseResult]],
+    record_property: Callable[[str, object], None],
+    layout: str,
+    dpi: int,
+) -> None:
+    """A reference layout renders at its expected scaled sizes, in budget."""
+    result = renders[layout, dpi].result(timeout=120)
+    record_property("layout_seconds", result.seconds)
+
+    mismatches = {
+        name: f"measured {measured}, expected {expected} (±{tolerance})"
+        for name, (measured, expected, tolerance) in result.checks.items()
+        if not _matches(measured, expected, tolerance)
+    }
+    assert not mismatches
+    assert result.seconds < MAX_LAYOUT_SECONDS